@@ -0,0 +1,45 @@
+"""
+Convert the backend's CSV data files to Arrow IPC and Parquet
+
+The API prefers these copies of each data file while they are at least as new
+as the CSV: the uncompressed Arrow IPC (Feather v2) file is memory mapped and
+shared by all worker processes, and the zstd Parquet file is the compact
+fallback. Re-run this after regenerating the data; the API notices the newer
+files on its next request.
+
+Usage: python convert_data.py [data_dir]
+"""
+
+from pathlib import Path
+import sys
+
+import pyarrow.csv as pv
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+
+DATA_FILES = [
+    "nj_municipalities",
+    "consolidation_scenarios",
+    "city_comparisons",
+    "economic_impact",
+]
+
+def convert(data_dir: Path) -> None:
+    for name in DATA_FILES:
+        csv_path = data_dir / f"{name}.csv"
+        if not csv_path.exists():
+            print(f"Skipping {csv_path}: not found")
+            continue
+
+        table = pv.read_csv(csv_path)
+
+        # Compressed IPC buffers cannot be memory mapped without a copy
+        arrow_path = data_dir / f"{name}.arrow"
+        feather.write_feather(table, arrow_path, compression="uncompressed")
+
+        parquet_path = data_dir / f"{name}.parquet"
+        pq.write_table(table, parquet_path, compression="zstd")
+        print(f"Wrote {arrow_path} and {parquet_path} ({table.num_rows} rows)")
+
+if __name__ == "__main__":
+    convert(Path(sys.argv[1]) if len(sys.argv) > 1 else Path("../data"))
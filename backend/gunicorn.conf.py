@@ -0,0 +1,22 @@
+"""
+Gunicorn configuration for the FastAPI backend
+
+Usage (from the backend directory): gunicorn -c gunicorn.conf.py
+"""
+
+import multiprocessing
+import os
+
+wsgi_app = "main:app"
+bind = "0.0.0.0:8000"
+# Each worker notices regenerated data files on its own, so any count is safe
+workers = int(os.environ.get("WEB_CONCURRENCY", 2 * multiprocessing.cpu_count() + 1))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Import the app once in the master so workers share its memory copy-on-write
+preload_app = True
+
+def when_ready(server):
+    # Runs in the master after the app is preloaded and before workers fork
+    from main import warm_caches
+    warm_caches()
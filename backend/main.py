@@ -3,13 +3,24 @@ FastAPI Backend for New Jersey Consolidation Analysis
 Serves data from existing Python analysis to React frontend
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.concurrency import run_in_threadpool
 from pathlib import Path
-import pandas as pd
+from functools import lru_cache, wraps
+import hashlib
 import json
-from typing import List, Dict, Any
+import orjson
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+from typing import List, Dict, Any, NamedTuple, Optional
+from pydantic import BaseModel, TypeAdapter
 import sys
 import os
 
@@ -19,149 +30,368 @@ sys.path.append(str(Path(__file__).parent.parent / "src"))
 from tiger_boundaries import TIGERBoundaryCreator
 from visualizations import NJVisualizationCreator
 
-app = FastAPI(title="New Jersey Consolidation Analysis API", version="1.0.0")
+app = FastAPI(
+    title="New Jersey Consolidation Analysis API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse
+)
 
 # Enable CORS for React frontend
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000", "http://localhost:8053"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # The frontend only issues GETs with these headers; caching the preflight
+    # for a day saves an OPTIONS round trip per cross-origin request
+    allow_methods=["GET"],
+    allow_headers=["accept", "content-type", "if-none-match"],
+    max_age=86400,
 )
 
+# Compress JSON payloads and map HTML; small responses are not worth it
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Mount static files for serving generated maps (create directory if it doesn't exist)
 import os
 visualizations_dir = Path("../visualizations")
 visualizations_dir.mkdir(exist_ok=True)
 app.mount("/static", StaticFiles(directory=str(visualizations_dir)), name="static")
 
+# Map files served by the /api/maps endpoints, generated on first request if missing
+MUNI_MAP_PATH = visualizations_dir / "tiger_municipal_boundaries_map.html"
+CONSOL_MAP_PATH = visualizations_dir / "tiger_consolidation_map.html"
+
 # Initialize data creators
 tiger_creator = TIGERBoundaryCreator()
 viz_creator = NJVisualizationCreator()
 
+DATA_DIR = Path("../data")
+
+def is_fresh(path: Path, csv_path: Path) -> bool:
+    """Whether a converted copy exists and is at least as new as its CSV"""
+    return path.exists() and (
+        not csv_path.exists() or path.stat().st_mtime >= csv_path.stat().st_mtime
+    )
+
+def read_data_file(name: str) -> pa.Table:
+    """Read a data file into an Arrow table, preferring the converted copies
+
+    convert_data.py writes an Arrow IPC file and a Parquet file next to each
+    CSV; either is only used while it is at least as new as the CSV, so
+    regenerating the CSVs never serves stale data. The IPC file is memory
+    mapped, so every worker process reads the same page-cache pages instead
+    of holding its own copy of the table.
+    """
+    csv_path = DATA_DIR / f"{name}.csv"
+    arrow_path = DATA_DIR / f"{name}.arrow"
+    parquet_path = DATA_DIR / f"{name}.parquet"
+    if is_fresh(arrow_path, csv_path):
+        return ipc.open_file(pa.memory_map(str(arrow_path))).read_all()
+    if is_fresh(parquet_path, csv_path):
+        return pq.read_table(parquet_path)
+    return pv.read_csv(csv_path)
+
+class MunicipalityTables(NamedTuple):
+    all: pa.Table
+    target_region: pa.Table
+
+def data_paths(name: str) -> tuple:
+    """Every file read_data_file may read for a data set"""
+    return tuple(DATA_DIR / f"{name}{suffix}" for suffix in (".csv", ".arrow", ".parquet"))
+
+def files_version(paths) -> tuple:
+    """Modification time of each path, None for files that do not exist"""
+    version = []
+    for path in paths:
+        try:
+            version.append(path.stat().st_mtime_ns)
+        except FileNotFoundError:
+            version.append(None)
+    return tuple(version)
+
+def cached_until_changed(*paths: Path):
+    """Memoize a zero-argument loader until one of its source files changes
+
+    The result is keyed on the files' modification times, so every worker
+    process picks up regenerated data on its next request without any
+    coordination between them; a stat per file is all a warm call costs.
+    """
+    def decorator(func):
+        cached = lru_cache(maxsize=1)(lambda version: func())
+
+        @wraps(func)
+        def wrapper():
+            return cached(files_version(paths))
+        return wrapper
+    return decorator
+
+MUNICIPALITY_FILES = data_paths("nj_municipalities")
+SCENARIO_FILES = data_paths("consolidation_scenarios")
+COMPARISON_FILES = data_paths("city_comparisons")
+ECONOMIC_IMPACT_FILES = data_paths("economic_impact")
+INSIGHTS_FILES = (DATA_DIR / "analysis_insights.json",)
+
+# The source files only change when the analysis pipeline is re-run, so each one
+# is parsed once per process and served from memory until it is modified.
+@cached_until_changed(*MUNICIPALITY_FILES)
+def load_municipalities() -> MunicipalityTables:
+    """All municipalities plus the target-region view, filtered once per load"""
+    municipalities = read_data_file("nj_municipalities")
+    target_region = municipalities.filter(municipalities['in_target_region'])
+    return MunicipalityTables(municipalities, target_region)
+
+@cached_until_changed(*SCENARIO_FILES)
+def load_scenarios() -> pa.Table:
+    return read_data_file("consolidation_scenarios")
+
+@cached_until_changed(*COMPARISON_FILES)
+def load_comparisons() -> pa.Table:
+    return read_data_file("city_comparisons")
+
+@cached_until_changed(*ECONOMIC_IMPACT_FILES)
+def load_economic_impact() -> pa.Table:
+    return read_data_file("economic_impact")
+
+@cached_until_changed(*INSIGHTS_FILES)
+def load_insights() -> Dict[str, Any]:
+    with open(DATA_DIR / "analysis_insights.json", 'r') as f:
+        return json.load(f)
+
+@cached_until_changed(*MUNICIPALITY_FILES)
+def load_county_summary() -> List[Dict[str, Any]]:
+    """Aggregate the target region by county; redone only when the data changes"""
+    target_region = load_municipalities().target_region
+
+    grouped = target_region.group_by('county').aggregate([
+        ('population_2020', 'sum'),
+        ('area_sq_miles', 'sum'),
+        ('municipality', 'count')
+    ])
+
+    # Build the output table in one step from the aggregated columns
+    population = grouped['population_2020_sum']
+    area = grouped['area_sq_miles_sum']
+    county_summary = pa.table({
+        'county': grouped['county'],
+        'population': population,
+        'area_sq_miles': area,
+        'municipalities': grouped['municipality_count'],
+        'population_density': pc.divide(population, area)
+    })
+
+    return county_summary.sort_by('county').to_pylist()
+
+DEFAULT_INSIGHTS = {
+    "total_population": 3610711,
+    "us_rank": 3,
+    "world_rank": 58,
+    "municipalities_count": 142,
+    "counties": ["Bergen", "Essex", "Hudson", "Passaic", "Union"]
+}
+
+# Response schemas. Rows are validated against these once, when the cache is
+# filled, and serialized by pydantic-core straight to JSON bytes.
+class Municipality(BaseModel):
+    municipality: str
+    county: str
+    population_2020: int
+    area_sq_miles: float
+    population_density: float
+    in_target_region: bool
+
+class County(BaseModel):
+    county: str
+    population: int
+    area_sq_miles: float
+    municipalities: int
+    population_density: float
+
+class ConsolidationScenario(BaseModel):
+    scenario: str
+    counties_included: str
+    estimated_population: int
+    municipalities_count: int
+    us_city_rank: Optional[int] = None
+    world_city_rank: Optional[int] = None
+
+class CityComparison(BaseModel):
+    city: str
+    country: str
+    population: int
+    area_sq_km: float
+    density_per_sq_km: float
+
+class EconomicImpact(BaseModel):
+    metric: str
+    current_value: float
+    consolidated_value: float
+    unit: str
+    description: str
+
+MUNICIPALITIES_ADAPTER = TypeAdapter(List[Municipality])
+COUNTIES_ADAPTER = TypeAdapter(List[County])
+SCENARIOS_ADAPTER = TypeAdapter(List[ConsolidationScenario])
+COMPARISONS_ADAPTER = TypeAdapter(List[CityComparison])
+ECONOMIC_IMPACT_ADAPTER = TypeAdapter(List[EconomicImpact])
+
+class Payload(NamedTuple):
+    body: bytes
+    etag: str
+
+def to_payload(obj: Any, adapter: TypeAdapter = None) -> Payload:
+    """Serialize a response body and tag it with a hash of its content"""
+    if adapter is None:
+        body = orjson.dumps(obj)
+    else:
+        body = adapter.dump_json(adapter.validate_python(obj))
+    return Payload(body, f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"')
+
+# Serialized response bodies, rebuilt only when their source files change
+@cached_until_changed(*MUNICIPALITY_FILES)
+def municipalities_json() -> Payload:
+    return to_payload(load_municipalities().all.to_pylist(), MUNICIPALITIES_ADAPTER)
+
+@cached_until_changed(*MUNICIPALITY_FILES)
+def target_region_json() -> Payload:
+    return to_payload(load_municipalities().target_region.to_pylist(), MUNICIPALITIES_ADAPTER)
+
+@cached_until_changed(*MUNICIPALITY_FILES)
+def counties_json() -> Payload:
+    return to_payload(load_county_summary(), COUNTIES_ADAPTER)
+
+@cached_until_changed(*SCENARIO_FILES)
+def scenarios_json() -> Payload:
+    return to_payload(load_scenarios().to_pylist(), SCENARIOS_ADAPTER)
+
+@cached_until_changed(*COMPARISON_FILES)
+def comparisons_json() -> Payload:
+    return to_payload(load_comparisons().to_pylist(), COMPARISONS_ADAPTER)
+
+@cached_until_changed(*ECONOMIC_IMPACT_FILES)
+def economic_impact_json() -> Payload:
+    return to_payload(load_economic_impact().to_pylist(), ECONOMIC_IMPACT_ADAPTER)
+
+@cached_until_changed(*INSIGHTS_FILES)
+def insights_json() -> Payload:
+    try:
+        return to_payload(load_insights())
+    except FileNotFoundError:
+        # Return default insights if file doesn't exist
+        return to_payload(DEFAULT_INSIGHTS)
+
+def warm_caches() -> None:
+    """Build every cached response body up front
+
+    Called from gunicorn.conf.py in the master process so that forked workers
+    share the parsed data copy-on-write instead of each parsing it again.
+    """
+    for builder in (municipalities_json, target_region_json, counties_json,
+                    scenarios_json, comparisons_json, economic_impact_json, insights_json):
+        try:
+            builder()
+        except FileNotFoundError:
+            pass
+
+# Data only changes when the analysis is re-run; revalidate hourly via ETag
+CACHE_CONTROL = "public, max-age=3600"
+
+# Endpoints call the cached builders through run_in_threadpool: a cold cache
+# parses files from disk, which must not block the event loop.
+def json_response(request: Request, payload: Payload) -> Response:
+    headers = {"ETag": payload.etag, "Cache-Control": CACHE_CONTROL}
+    if request.headers.get("if-none-match") == payload.etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload.body, media_type="application/json", headers=headers)
+
+async def map_response(request: Request, map_path: Path, create_map) -> Response:
+    # A single stat both detects a missing map and feeds the ETag below
+    try:
+        stat_result = map_path.stat()
+    except FileNotFoundError:
+        await run_in_threadpool(create_map)
+        stat_result = map_path.stat()
+
+    # Maps are regenerated in place, so tag them by modification time and size
+    etag = f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return FileResponse(map_path, media_type="text/html", headers=headers, stat_result=stat_result)
+
 @app.get("/")
 async def root():
     return {"message": "New Jersey Consolidation Analysis API"}
 
-@app.get("/api/municipalities")
-async def get_municipalities():
+@app.get("/api/municipalities", response_model=List[Municipality])
+async def get_municipalities(request: Request):
     """Get all municipalities data"""
     try:
-        municipalities_df = pd.read_csv("../data/nj_municipalities.csv")
-        return municipalities_df.to_dict("records")
+        return json_response(request, await run_in_threadpool(municipalities_json))
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Municipalities data not found")
 
-@app.get("/api/municipalities/target-region")
-async def get_target_region_municipalities():
+@app.get("/api/municipalities/target-region", response_model=List[Municipality])
+async def get_target_region_municipalities(request: Request):
     """Get municipalities in the target 5-county region"""
     try:
-        municipalities_df = pd.read_csv("../data/nj_municipalities.csv")
-        target_region = municipalities_df[municipalities_df['in_target_region'] == True]
-        return target_region.to_dict("records")
+        return json_response(request, await run_in_threadpool(target_region_json))
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Municipalities data not found")
 
-@app.get("/api/counties")
-async def get_counties():
+@app.get("/api/counties", response_model=List[County])
+async def get_counties(request: Request):
     """Get county summary data"""
     try:
-        municipalities_df = pd.read_csv("../data/nj_municipalities.csv")
-        target_region = municipalities_df[municipalities_df['in_target_region'] == True]
-        
-        county_summary = target_region.groupby('county').agg({
-            'population_2020': 'sum',
-            'area_sq_miles': 'sum',
-            'municipality': 'count'
-        }).reset_index()
-        
-        county_summary.columns = ['county', 'population', 'area_sq_miles', 'municipalities']
-        county_summary['population_density'] = county_summary['population'] / county_summary['area_sq_miles']
-        
-        return county_summary.to_dict("records")
+        return json_response(request, await run_in_threadpool(counties_json))
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Municipalities data not found")
 
-@app.get("/api/scenarios")
-async def get_consolidation_scenarios():
+@app.get("/api/scenarios", response_model=List[ConsolidationScenario])
+async def get_consolidation_scenarios(request: Request):
     """Get consolidation scenarios data"""
     try:
-        scenarios_df = pd.read_csv("../data/consolidation_scenarios.csv")
-        return scenarios_df.to_dict("records")
+        return json_response(request, await run_in_threadpool(scenarios_json))
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Scenarios data not found")
 
-@app.get("/api/comparisons")
-async def get_city_comparisons():
+@app.get("/api/comparisons", response_model=List[CityComparison])
+async def get_city_comparisons(request: Request):
     """Get world city comparison data"""
     try:
-        comparisons_df = pd.read_csv("../data/city_comparisons.csv")
-        return comparisons_df.to_dict("records")
+        return json_response(request, await run_in_threadpool(comparisons_json))
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="City comparisons data not found")
 
-@app.get("/api/economic-impact")
-async def get_economic_impact():
+@app.get("/api/economic-impact", response_model=List[EconomicImpact])
+async def get_economic_impact(request: Request):
     """Get economic impact data"""
     try:
-        economic_df = pd.read_csv("../data/economic_impact.csv")
-        return economic_df.to_dict("records")
+        return json_response(request, await run_in_threadpool(economic_impact_json))
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Economic impact data not found")
 
 @app.get("/api/maps/municipal-boundaries")
-async def get_municipal_boundaries_map():
+async def get_municipal_boundaries_map(request: Request):
     """Generate and return municipal boundaries map"""
     try:
         # Use the TIGER municipalities map which has proper boundaries
-        map_path = Path("../visualizations/tiger_municipal_boundaries_map.html")
-        if not map_path.exists():
-            # Generate TIGER map if it doesn't exist
-            tiger_creator.create_tiger_municipalities_map()
-        
-        # Return the map HTML content
-        with open(map_path, 'r') as f:
-            map_html = f.read()
-        
-        return {"html": map_html}
+        return await map_response(request, MUNI_MAP_PATH, tiger_creator.create_tiger_municipalities_map)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating map: {str(e)}")
 
 @app.get("/api/maps/consolidation")
-async def get_consolidation_map():
+async def get_consolidation_map(request: Request):
     """Generate and return consolidation scenarios map"""
     try:
         # Use the TIGER consolidation map which has proper county boundaries and working 3-county toggle
-        map_path = Path("../visualizations/tiger_consolidation_map.html")
-        if not map_path.exists():
-            # Generate TIGER consolidation map if it doesn't exist
-            tiger_creator.create_tiger_consolidation_map()
-        
-        # Return the map HTML content
-        with open(map_path, 'r') as f:
-            map_html = f.read()
-        
-        return {"html": map_html}
+        return await map_response(request, CONSOL_MAP_PATH, tiger_creator.create_tiger_consolidation_map)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating map: {str(e)}")
 
 @app.get("/api/insights")
-async def get_insights():
+async def get_insights(request: Request):
     """Get key insights and analysis results"""
-    try:
-        with open("../data/analysis_insights.json", 'r') as f:
-            insights = json.load(f)
-        return insights
-    except FileNotFoundError:
-        # Return default insights if file doesn't exist
-        return {
-            "total_population": 3610711,
-            "us_rank": 3,
-            "world_rank": 58,
-            "municipalities_count": 142,
-            "counties": ["Bergen", "Essex", "Hudson", "Passaic", "Union"]
-        }
+    return json_response(request, await run_in_threadpool(insights_json))
 
 @app.get("/api/health")
 async def health_check():
@@ -169,5 +399,24 @@ async def health_check():
     return {"status": "healthy", "message": "API is running"}
 
 if __name__ == "__main__":
+    import argparse
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+
+    parser = argparse.ArgumentParser(description="Run the consolidation analysis API")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("WEB_CONCURRENCY", 1)),
+        help="Worker processes to start (default: $WEB_CONCURRENCY or 1)"
+    )
+    args = parser.parse_args()
+
+    # uvloop is not available on Windows; httptools is
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=args.workers
+    )
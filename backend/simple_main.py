@@ -3,23 +3,137 @@ Simple FastAPI Backend for New Jersey Consolidation Analysis
 Serves basic data without requiring all files to exist
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import FileResponse, HTMLResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from pathlib import Path
+import html
 import json
+import orjson
+import os
+import sys
 from typing import List, Dict, Any
 
-app = FastAPI(title="New Jersey Consolidation Analysis API", version="1.0.0")
+app = FastAPI(
+    title="New Jersey Consolidation Analysis API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse
+)
 
 # Enable CORS for React frontend
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000", "http://localhost:8053"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # The frontend only issues GETs with these headers; caching the preflight
+    # for a day saves an OPTIONS round trip per cross-origin request
+    allow_methods=["GET"],
+    allow_headers=["accept", "content-type", "if-none-match"],
+    max_age=86400,
 )
 
+# Compress JSON payloads and map HTML; small responses are not worth it
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Static payloads, serialized once at import
+INSIGHTS = {
+    "total_population": 3610711,
+    "us_rank": 3,
+    "world_rank": 58,
+    "municipalities_count": 142,
+    "counties": ["Bergen", "Essex", "Hudson", "Passaic", "Union"]
+}
+
+COUNTIES = [
+    {
+        "county": "Bergen",
+        "population": 950000,
+        "area_sq_miles": 234.5,
+        "municipalities": 70,
+        "population_density": 4051
+    },
+    {
+        "county": "Essex", 
+        "population": 850000,
+        "area_sq_miles": 126.2,
+        "municipalities": 22,
+        "population_density": 6735
+    },
+    {
+        "county": "Hudson",
+        "population": 724854,
+        "area_sq_miles": 46.2,
+        "municipalities": 12,
+        "population_density": 15689
+    },
+    {
+        "county": "Passaic",
+        "population": 524118,
+        "area_sq_miles": 185.0,
+        "municipalities": 16,
+        "population_density": 2833
+    },
+    {
+        "county": "Union",
+        "population": 561719,
+        "area_sq_miles": 103.0,
+        "municipalities": 21,
+        "population_density": 5454
+    }
+]
+
+CITY_COMPARISONS = [
+    {"city": "Tokyo", "country": "Japan", "population": 37400068, "area_sq_km": 13572, "density_per_sq_km": 2755},
+    {"city": "Delhi", "country": "India", "population": 32941000, "area_sq_km": 1484, "density_per_sq_km": 22200},
+    {"city": "Shanghai", "country": "China", "population": 24870895, "area_sq_km": 6341, "density_per_sq_km": 3922},
+    {"city": "Dhaka", "country": "Bangladesh", "population": 21741000, "area_sq_km": 306, "density_per_sq_km": 71049},
+    {"city": "São Paulo", "country": "Brazil", "population": 12396372, "area_sq_km": 1521, "density_per_sq_km": 8148},
+    {"city": "Cairo", "country": "Egypt", "population": 10230350, "area_sq_km": 606, "density_per_sq_km": 16882},
+    {"city": "Mumbai", "country": "India", "population": 12478447, "area_sq_km": 603, "density_per_sq_km": 20694},
+    {"city": "Beijing", "country": "China", "population": 21540000, "area_sq_km": 16410, "density_per_sq_km": 1312},
+    {"city": "Osaka", "country": "Japan", "population": 19222665, "area_sq_km": 13193, "density_per_sq_km": 1457},
+    {"city": "Chongqing", "country": "China", "population": 16382376, "area_sq_km": 82403, "density_per_sq_km": 199}
+]
+
+_INSIGHTS_JSON = orjson.dumps(INSIGHTS)
+_COUNTIES_JSON = orjson.dumps(COUNTIES)
+_COMPARISONS_JSON = orjson.dumps(CITY_COMPARISONS)
+
+# Generated TIGER maps; each request stats the file once and streams it if present
+MUNI_MAP_PATH = Path("../visualizations/tiger_municipal_boundaries_map.html")
+CONSOL_MAP_PATH = Path("../visualizations/tiger_consolidation_map.html")
+
+# Shown in place of a map that is missing or failed to load
+MAP_MESSAGE_TEMPLATE = """
+<div style="width: 100%; height: 600px; background: #2d2d2d; display: flex; align-items: center; justify-content: center; color: white; font-size: 18px; border-radius: 8px;">
+    <div style="text-align: center;">
+        <h3 style="color: #ff6b35; margin-bottom: 20px;">{title}</h3>
+        <p>{message}</p>
+        <p style="color: #00d4ff; margin-top: 20px;">{hint}</p>
+    </div>
+</div>
+"""
+
+_MUNI_MAP_NOT_FOUND = MAP_MESSAGE_TEMPLATE.format(
+    title="Municipal Boundaries Map Not Found",
+    message="TIGER/Line municipal boundaries map not found.",
+    hint="Please generate maps first using the TIGER boundary creator."
+).encode()
+
+_CONSOL_MAP_NOT_FOUND = MAP_MESSAGE_TEMPLATE.format(
+    title="Consolidation Scenarios Map Not Found",
+    message="TIGER/Line consolidation scenarios map not found.",
+    hint="Please generate maps first using the TIGER boundary creator."
+).encode()
+
+def map_error_response(error: Exception) -> HTMLResponse:
+    return HTMLResponse(MAP_MESSAGE_TEMPLATE.format(
+        title="Error Loading Map",
+        message=f"Error: {html.escape(str(error))}",
+        hint="Please check the TIGER boundary creator configuration."
+    ))
+
 @app.get("/")
 async def root():
     return {"message": "New Jersey Consolidation Analysis API"}
@@ -32,142 +146,48 @@ async def health_check():
 @app.get("/api/insights")
 async def get_insights():
     """Get key insights and analysis results"""
-    return {
-        "total_population": 3610711,
-        "us_rank": 3,
-        "world_rank": 58,
-        "municipalities_count": 142,
-        "counties": ["Bergen", "Essex", "Hudson", "Passaic", "Union"]
-    }
+    return Response(_INSIGHTS_JSON, media_type="application/json")
 
 @app.get("/api/counties")
 async def get_counties():
     """Get county summary data"""
-    return [
-        {
-            "county": "Bergen",
-            "population": 950000,
-            "area_sq_miles": 234.5,
-            "municipalities": 70,
-            "population_density": 4051
-        },
-        {
-            "county": "Essex", 
-            "population": 850000,
-            "area_sq_miles": 126.2,
-            "municipalities": 22,
-            "population_density": 6735
-        },
-        {
-            "county": "Hudson",
-            "population": 724854,
-            "area_sq_miles": 46.2,
-            "municipalities": 12,
-            "population_density": 15689
-        },
-        {
-            "county": "Passaic",
-            "population": 524118,
-            "area_sq_miles": 185.0,
-            "municipalities": 16,
-            "population_density": 2833
-        },
-        {
-            "county": "Union",
-            "population": 561719,
-            "area_sq_miles": 103.0,
-            "municipalities": 21,
-            "population_density": 5454
-        }
-    ]
+    return Response(_COUNTIES_JSON, media_type="application/json")
 
 @app.get("/api/comparisons")
 async def get_city_comparisons():
     """Get world city comparison data"""
-    return [
-        {"city": "Tokyo", "country": "Japan", "population": 37400068, "area_sq_km": 13572, "density_per_sq_km": 2755},
-        {"city": "Delhi", "country": "India", "population": 32941000, "area_sq_km": 1484, "density_per_sq_km": 22200},
-        {"city": "Shanghai", "country": "China", "population": 24870895, "area_sq_km": 6341, "density_per_sq_km": 3922},
-        {"city": "Dhaka", "country": "Bangladesh", "population": 21741000, "area_sq_km": 306, "density_per_sq_km": 71049},
-        {"city": "São Paulo", "country": "Brazil", "population": 12396372, "area_sq_km": 1521, "density_per_sq_km": 8148},
-        {"city": "Cairo", "country": "Egypt", "population": 10230350, "area_sq_km": 606, "density_per_sq_km": 16882},
-        {"city": "Mumbai", "country": "India", "population": 12478447, "area_sq_km": 603, "density_per_sq_km": 20694},
-        {"city": "Beijing", "country": "China", "population": 21540000, "area_sq_km": 16410, "density_per_sq_km": 1312},
-        {"city": "Osaka", "country": "Japan", "population": 19222665, "area_sq_km": 13193, "density_per_sq_km": 1457},
-        {"city": "Chongqing", "country": "China", "population": 16382376, "area_sq_km": 82403, "density_per_sq_km": 199}
-    ]
+    return Response(_COMPARISONS_JSON, media_type="application/json")
 
 @app.get("/api/maps/municipal-boundaries")
 async def get_municipal_boundaries_map():
     """Return the actual municipal boundaries map from TIGER/Line data"""
     try:
-        map_path = Path("../visualizations/tiger_municipal_boundaries_map.html")
-        if map_path.exists():
-            with open(map_path, 'r', encoding='utf-8') as f:
-                map_html = f.read()
-            return {"html": map_html}
-        else:
-            # Return error message if TIGER map not found
-            return {
-                "html": """
-                <div style="width: 100%; height: 600px; background: #2d2d2d; display: flex; align-items: center; justify-content: center; color: white; font-size: 18px; border-radius: 8px;">
-                    <div style="text-align: center;">
-                        <h3 style="color: #ff6b35; margin-bottom: 20px;">Municipal Boundaries Map Not Found</h3>
-                        <p>TIGER/Line municipal boundaries map not found.</p>
-                        <p style="color: #00d4ff; margin-top: 20px;">Please generate maps first using the TIGER boundary creator.</p>
-                    </div>
-                </div>
-                """
-            }
+        return FileResponse(MUNI_MAP_PATH, media_type="text/html", stat_result=os.stat(MUNI_MAP_PATH))
+    except FileNotFoundError:
+        # Return error message if TIGER map not found
+        return HTMLResponse(_MUNI_MAP_NOT_FOUND)
     except Exception as e:
-        return {
-            "html": f"""
-            <div style="width: 100%; height: 600px; background: #2d2d2d; display: flex; align-items: center; justify-content: center; color: white; font-size: 18px; border-radius: 8px;">
-                <div style="text-align: center;">
-                    <h3 style="color: #ff6b35; margin-bottom: 20px;">Error Loading Map</h3>
-                    <p>Error: {str(e)}</p>
-                    <p style="color: #00d4ff; margin-top: 20px;">Please check the TIGER boundary creator configuration.</p>
-                </div>
-            </div>
-            """
-        }
+        return map_error_response(e)
 
 @app.get("/api/maps/consolidation")
 async def get_consolidation_map():
     """Return the actual consolidation scenarios map from TIGER/Line data"""
     try:
         # Use the newly generated TIGER consolidation map with proper L.geoJson boundaries and 3-county toggle
-        map_path = Path("../visualizations/tiger_consolidation_map.html")
-        if map_path.exists():
-            with open(map_path, 'r', encoding='utf-8') as f:
-                map_html = f.read()
-            return {"html": map_html}
-        else:
-            # Return error message if TIGER consolidation map not found
-            return {
-                "html": """
-                <div style="width: 100%; height: 600px; background: #2d2d2d; display: flex; align-items: center; justify-content: center; color: white; font-size: 18px; border-radius: 8px;">
-                    <div style="text-align: center;">
-                        <h3 style="color: #ff6b35; margin-bottom: 20px;">Consolidation Scenarios Map Not Found</h3>
-                        <p>TIGER/Line consolidation scenarios map not found.</p>
-                        <p style="color: #00d4ff; margin-top: 20px;">Please generate maps first using the TIGER boundary creator.</p>
-                    </div>
-                </div>
-                """
-            }
+        return FileResponse(CONSOL_MAP_PATH, media_type="text/html", stat_result=os.stat(CONSOL_MAP_PATH))
+    except FileNotFoundError:
+        # Return error message if TIGER consolidation map not found
+        return HTMLResponse(_CONSOL_MAP_NOT_FOUND)
     except Exception as e:
-        return {
-            "html": f"""
-            <div style="width: 100%; height: 600px; background: #2d2d2d; display: flex; align-items: center; justify-content: center; color: white; font-size: 18px; border-radius: 8px;">
-                <div style="text-align: center;">
-                    <h3 style="color: #ff6b35; margin-bottom: 20px;">Error Loading Map</h3>
-                    <p>Error: {str(e)}</p>
-                    <p style="color: #00d4ff; margin-top: 20px;">Please check the TIGER boundary creator configuration.</p>
-                </div>
-            </div>
-            """
-        }
+        return map_error_response(e)
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop is not available on Windows; httptools is
+    uvicorn.run(
+        "simple_main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools"
+    )
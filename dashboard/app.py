@@ -6,32 +6,203 @@ for exploring the potential benefits of municipal consolidation in Northern New
 """
 
 import dash
-from dash import dcc, html, Input, Output, callback
+from dash import dcc, html, Input, Output, State, MATCH
+from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
-import pandas as pd
-import plotly.express as px
+from flask_caching import Cache
+import numpy as np
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import json
+import plotly.io as pio
 from pathlib import Path
+from dataclasses import dataclass
+import os
 import sys
+import tempfile
 
 # Add src directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent / 'src'))
 
-from data_collection import NJDataCollector
-from analysis import NJConsolidationAnalyzer
-from visualizations import NJVisualizationCreator
+from kernels import county_reduce, bin_counts
+from data_io import read_table
+
+# Shared figure styling: the county/size palette plus the defaults every tab
+# used to repeat, layered on top of the stock plotly template. Figures opt in
+# with template=NJ_TEMPLATE; the process-wide default is left alone
+NJ_COLORS = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd']
+pio.templates['nj'] = go.layout.Template(layout=dict(
+    colorway=NJ_COLORS,
+    height=500,
+    showlegend=False
+))
+NJ_TEMPLATE = 'plotly+nj'
+
+# Municipality size categories: upper bin edges and their labels
+SIZE_BIN_EDGES = np.array([10000, 25000, 50000, 100000, np.inf])
+SIZE_LABELS = ['Small (<10k)', 'Medium (10k-25k)', 'Large (25k-50k)',
+               'Very Large (50k-100k)', 'Major (100k+)']
+
+# Dashboard tabs in display order
+TAB_LABELS = {
+    'population': "Population Analysis",
+    'rankings': "World Rankings",
+    'counties': "County Breakdown",
+    'economic': "Economic Impact",
+    'sizes': "Municipality Sizes"
+}
+
+@dataclass(frozen=True)
+class Region:
+    """Target-region columns as plain arrays, extracted once at load time"""
+    population: np.ndarray
+    area: np.ndarray
+    county_codes: np.ndarray
+    county_names: np.ndarray
+    population_total: int
+    
+    @classmethod
+    def from_frame(cls, df):
+        """Build from municipality rows with a categorical county column"""
+        county = df['county'].cat.remove_unused_categories().array
+        population = df['population_2020'].to_numpy()
+        return cls(
+            population=population,
+            area=df['area_sq_miles'].to_numpy(),
+            county_codes=county.codes,
+            county_names=county.categories.to_numpy(),
+            population_total=int(population.sum())
+        )
+
+@dataclass(frozen=True)
+class CountySummary:
+    """Per-county totals and their bar labels, computed once at load time"""
+    counties: np.ndarray
+    population: np.ndarray
+    area: np.ndarray
+    municipalities: np.ndarray
+    density: np.ndarray
+    population_text: tuple
+    density_text: tuple
+    area_text: tuple
+    
+    @classmethod
+    def from_region(cls, region):
+        """Reduce a Region to one row per county, in county name order"""
+        population, area, municipalities = county_reduce(
+            region.county_codes,
+            region.population,
+            region.area,
+            len(region.county_names)
+        )
+        density = population / area
+        return cls(
+            counties=region.county_names,
+            population=population,
+            area=area,
+            municipalities=municipalities,
+            density=density,
+            population_text=tuple(f"{pop:,}" for pop in population.tolist()),
+            density_text=tuple(f"{value:.0f}" for value in density.tolist()),
+            area_text=tuple(f"{value:.1f}" for value in area.tolist())
+        )
 
 class NJConsolidationDashboard:
     """Interactive dashboard for New Jersey consolidation analysis"""
     
     def __init__(self):
-        self.app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
+        self.app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP], compress=True)
+        # Assets (figure JSON, CSS) are fingerprinted with ?v=/?m= query
+        # strings, so browsers can keep them for a year
+        self.app.server.config['SEND_FILE_MAX_AGE_DEFAULT'] = 31536000
         self.data_dir = Path(__file__).parent.parent / 'data'
+        
+        # Rendered tabs are shared across worker processes and restarts; set
+        # NJ_DASHBOARD_CACHE_TYPE=RedisCache (plus CACHE_REDIS_URL) in production
+        self.cache = Cache(self.app.server, config={
+            'CACHE_TYPE': os.environ.get('NJ_DASHBOARD_CACHE_TYPE', 'FileSystemCache'),
+            'CACHE_DIR': str(Path(tempfile.gettempdir()) / 'nj_dashboard_cache'),
+            'CACHE_REDIS_URL': os.environ.get('CACHE_REDIS_URL'),
+            'CACHE_DEFAULT_TIMEOUT': 0
+        })
+        
+        # Figures are written here as JSON and fetched by the browser, so the
+        # HTTP cache serves repeat views without any Python work
+        self.figs_dir = Path(self.app.config.assets_folder) / 'figs'
+        self.figs_dir.mkdir(parents=True, exist_ok=True)
+        
+        self._load_data()
+        # Tab content only depends on the static CSVs, so build every tab up
+        # front and keep figure construction out of the callback entirely
+        self._dispatch = {
+            'population': self.create_population_tab,
+            'rankings': self.create_rankings_tab,
+            'counties': self.create_counties_tab,
+            'economic': self.create_economic_tab,
+            'sizes': self.create_sizes_tab
+        }
+        self._tab_children = {
+            tab_id: self._cached_tab(tab_id, builder)
+            for tab_id, builder in self._dispatch.items()
+        }
         self.setup_layout()
         self.setup_callbacks()
     
+    def _load_data(self):
+        """Read the data files once; a missing file leaves its frame as None"""
+        def read_csv(filename):
+            try:
+                return read_table(self.data_dir / filename)
+            except FileNotFoundError:
+                return None
+        
+        self._municipalities = read_csv('nj_municipalities.csv')
+        self._scenarios = read_csv('consolidation_scenarios.csv')
+        self._comparisons = read_csv('city_comparisons.csv')
+        
+        if self._municipalities is not None:
+            # County as a categorical: grouping works on small integer codes,
+            # and categories are kept in name order
+            self._municipalities['county'] = self._municipalities['county'].astype('category')
+            self._region = Region.from_frame(
+                self._municipalities[self._municipalities['in_target_region']]
+            )
+            self._county_summary = CountySummary.from_region(self._region)
+        else:
+            self._region = None
+            self._county_summary = None
+        
+        # Cached tabs are keyed on this, so regenerating the data, editing
+        # this module or editing an HTML fragment embedded in a tab
+        # invalidates them
+        sources = [Path(__file__)] + [self.data_dir / name for name in (
+            'nj_municipalities.csv', 'consolidation_scenarios.csv', 'city_comparisons.csv'
+        )] + sorted(Path(self.app.config.assets_folder).glob('*.html'))
+        self._data_version = max(path.stat().st_mtime_ns if path.exists() else 0 for path in sources)
+    
+    def _cached_tab(self, tab_id, builder):
+        """Fetch a tab's children from the shared cache, building them on a miss"""
+        key = f"tab:{tab_id}:{self._data_version}"
+        children = self.cache.get(key)
+        # A cached tab is only usable if its figure file is still on disk
+        if children is None or not (self.figs_dir / f'{tab_id}.json').exists():
+            children = builder()
+            self.cache.set(key, children)
+        return children
+    
+    def _figure_graph(self, tab_id, fig=None):
+        """Write a tab's figure to assets (if given) and return a graph that fetches it"""
+        if fig is not None:
+            (self.figs_dir / f'{tab_id}.json').write_text(fig.to_json())
+        url = self.app.get_asset_url(f'figs/{tab_id}.json') + f'?v={self._data_version}'
+        return html.Div([
+            dcc.Store(id={'type': 'figure-src', 'tab': tab_id}, data=url),
+            dcc.Graph(id={'type': 'tab-graph', 'tab': tab_id})
+        ])
+    
+    def _html_fragment(self, filename):
+        """Render a static HTML fragment from assets, read once at startup"""
+        text = (Path(self.app.config.assets_folder) / filename).read_text(encoding='utf-8')
+        return dcc.Markdown(text, dangerously_allow_html=True)
+    
     def setup_layout(self):
         """Set up the dashboard layout"""
         
@@ -45,113 +216,78 @@ class NJConsolidationDashboard:
         )
         
         # Introduction card
-        intro_card = dbc.Card([
-            dbc.CardBody([
-                html.H4("The Case for Greater Jersey City", className="card-title"),
-                html.P([
-                    "This dashboard explores the potential for consolidating Northern New Jersey's ",
-                    "fragmented municipalities into a single, more efficient city. Based on the concept ",
-                    "presented in ",
-                    html.A("this article", href="https://papaghanoush.substack.com/p/new-jerseys-potential-and-a-plea", 
-                          target="_blank"),
-                    ", a consolidated Northern New Jersey would become the ",
-                    html.Strong("3rd largest city in the United States"),
-                    " with over 3.6 million people."
-                ]),
-                dbc.Alert([
-                    html.H5("Key Insight", className="alert-heading"),
-                    "If Bergen, Essex, Hudson, Passaic, and Union counties were consolidated into one city, "
-                    "it would rank 58th globally, ahead of Madrid, Buenos Aires, and Toronto."
-                ], color="info")
-            ])
-        ])
+        intro_card = self._html_fragment('intro.html')
         
-        # Main content tabs
+        # Main content tabs; each tab owns its content container, filled the
+        # first time the tab is opened
         tabs = dbc.Tabs([
-            dbc.Tab(label="Population Analysis", tab_id="population"),
-            dbc.Tab(label="World Rankings", tab_id="rankings"),
-            dbc.Tab(label="County Breakdown", tab_id="counties"),
-            dbc.Tab(label="Economic Impact", tab_id="economic"),
-            dbc.Tab(label="Municipality Sizes", tab_id="sizes")
+            dbc.Tab(
+                dcc.Loading(html.Div(id=f"tab-{tab_id}", className="mt-4"), type="default"),
+                label=label,
+                tab_id=tab_id
+            )
+            for tab_id, label in TAB_LABELS.items()
         ], id="main-tabs", active_tab="population")
         
-        # Content area
-        content = html.Div(id="tab-content", className="mt-4")
-        
         # Footer
-        footer = dbc.Card([
-            dbc.CardBody([
-                html.P([
-                    "Data sources: US Census Bureau, New Jersey Department of State, ",
-                    "and analysis based on municipal consolidation research."
-                ], className="text-muted small"),
-                html.P([
-                    "Inspired by: ",
-                    html.A("New Jersey's Potential and a Plea for a Greater Jersey City", 
-                          href="https://papaghanoush.substack.com/p/new-jerseys-potential-and-a-plea",
-                          target="_blank")
-                ], className="text-muted small")
-            ])
-        ], className="mt-4")
+        footer = self._html_fragment('footer.html')
         
         # Assemble layout
         self.app.layout = dbc.Container([
             header,
             intro_card,
             tabs,
-            content,
             footer
         ], fluid=True)
     
     def setup_callbacks(self):
         """Set up dashboard callbacks"""
         
-        @self.app.callback(
-            Output('tab-content', 'children'),
-            Input('main-tabs', 'active_tab')
+        # One callback per tab: only the active tab is sent, and only once
+        for tab_id in self._tab_children:
+            self.app.callback(
+                Output(f'tab-{tab_id}', 'children'),
+                Input('main-tabs', 'active_tab'),
+                State(f'tab-{tab_id}', 'children')
+            )(self._tab_loader(tab_id))
+        
+        # Each tab's graph loads its figure JSON when the tab is shown
+        self.app.clientside_callback(
+            """
+            function(src) {
+                if (!src) {
+                    return window.dash_clientside.no_update;
+                }
+                return fetch(src).then(function(response) { return response.json(); });
+            }
+            """,
+            Output({'type': 'tab-graph', 'tab': MATCH}, 'figure'),
+            Input({'type': 'figure-src', 'tab': MATCH}, 'data')
         )
-        def render_tab_content(active_tab):
-            if active_tab == "population":
-                return self.create_population_tab()
-            elif active_tab == "rankings":
-                return self.create_rankings_tab()
-            elif active_tab == "counties":
-                return self.create_counties_tab()
-            elif active_tab == "economic":
-                return self.create_economic_tab()
-            elif active_tab == "sizes":
-                return self.create_sizes_tab()
-            else:
-                return html.Div("Select a tab to view content")
+    
+    def _tab_loader(self, tab_id):
+        """Build the callback that fills one tab's container when it is opened"""
+        def load_tab(active_tab, children):
+            if active_tab != tab_id or children:
+                raise PreventUpdate
+            return self._tab_children[tab_id]
+        return load_tab
     
     def create_population_tab(self):
         """Create the population analysis tab"""
         
-        # Load data
-        try:
-            municipalities = pd.read_csv(self.data_dir / 'nj_municipalities.csv')
-            scenarios = pd.read_csv(self.data_dir / 'consolidation_scenarios.csv')
-        except FileNotFoundError:
+        if self._municipalities is None or self._scenarios is None:
             return dbc.Alert("Data not found. Please run data collection first.", color="warning")
         
-        target_region = municipalities[municipalities['in_target_region']]
+        # Only needed when a figure is actually (re)built
+        from plotly.subplots import make_subplots
         
-        # Population comparison chart
-        comparison_data = {
-            'Scenario': ['Current (Fragmented)', '5-County Consolidation', '3-County Core'],
-            'Population': [
-                target_region['population_2020'].sum(),
-                3610711,
-                2500000
-            ],
-            'Municipalities': [
-                len(target_region),
-                1,
-                1
-            ]
-        }
+        region = self._region
         
-        df = pd.DataFrame(comparison_data)
+        # Population comparison chart
+        scenarios = ['Current (Fragmented)', '5-County Consolidation', '3-County Core']
+        populations = [region.population_total, 3610711, 2500000]
+        municipalities = [len(region.population), 1, 1]
         
         fig = make_subplots(
             rows=1, cols=2,
@@ -161,11 +297,11 @@ class NJConsolidationDashboard:
         
         fig.add_trace(
             go.Bar(
-                x=df['Scenario'],
-                y=df['Population'],
+                x=scenarios,
+                y=populations,
                 name='Population',
                 marker_color=['#1f77b4', '#2ca02c', '#ff7f0e'],
-                text=[f"{pop:,}" for pop in df['Population']],
+                text=tuple(f"{pop:,}" for pop in populations),
                 textposition='auto'
             ),
             row=1, col=1
@@ -173,20 +309,19 @@ class NJConsolidationDashboard:
         
         fig.add_trace(
             go.Bar(
-                x=df['Scenario'],
-                y=df['Municipalities'],
+                x=scenarios,
+                y=municipalities,
                 name='Municipalities',
                 marker_color=['#ff7f0e', '#9467bd', '#bcbd22'],
-                text=df['Municipalities'],
+                text=municipalities,
                 textposition='auto'
             ),
             row=1, col=2
         )
         
         fig.update_layout(
-            title='New Jersey Consolidation: Population and Government Structure',
-            showlegend=False,
-            height=500
+            template=NJ_TEMPLATE,
+            title='New Jersey Consolidation: Population and Government Structure'
         )
         
         # Key statistics cards
@@ -194,7 +329,7 @@ class NJConsolidationDashboard:
             dbc.Col([
                 dbc.Card([
                     dbc.CardBody([
-                        html.H4(f"{target_region['population_2020'].sum():,}", className="text-primary"),
+                        html.H4(f"{region.population_total:,}", className="text-primary"),
                         html.P("Current Population", className="card-text")
                     ])
                 ])
@@ -227,7 +362,7 @@ class NJConsolidationDashboard:
         
         return html.Div([
             stats_cards,
-            dcc.Graph(figure=fig),
+            self._figure_graph('population', fig),
             dbc.Card([
                 dbc.CardBody([
                     html.H5("Population Analysis Insights"),
@@ -244,53 +379,47 @@ class NJConsolidationDashboard:
     def create_rankings_tab(self):
         """Create the world rankings tab"""
         
-        try:
-            comparisons = pd.read_csv(self.data_dir / 'city_comparisons.csv')
-        except FileNotFoundError:
+        if self._comparisons is None:
             return dbc.Alert("Data not found. Please run data collection first.", color="warning")
         
         # Get top cities for comparison
-        top_cities = comparisons.nlargest(15, 'population')
-        
-        # Add consolidated NJ
-        nj_data = pd.DataFrame({
-            'city': ['Greater Jersey City (Proposed)'],
-            'country': ['USA'],
-            'population': [3610711],
-            'area_sq_km': [2000],
-            'density_per_sq_km': [1805]
-        })
+        top_cities = self._comparisons.nlargest(15, 'population')
         
-        comparison_data = pd.concat([top_cities, nj_data], ignore_index=True)
-        comparison_data = comparison_data.sort_values('population', ascending=True)
+        # Append consolidated NJ and sort once on plain arrays rather than
+        # building and concatenating a second DataFrame
+        cities = np.append(top_cities['city'].to_numpy(), 'Greater Jersey City (Proposed)')
+        countries = np.append(top_cities['country'].to_numpy(), 'USA')
+        populations = np.append(top_cities['population'].to_numpy(), 3610711)
+        
+        order = np.argsort(populations, kind='stable')
+        cities, countries, populations = cities[order], countries[order], populations[order]
         
         # Create chart
         fig = go.Figure()
         
-        colors = ['#2ca02c' if city == 'Greater Jersey City (Proposed)' 
-                 else '#1f77b4' for city in comparison_data['city']]
+        colors = np.where(cities == 'Greater Jersey City (Proposed)', '#2ca02c', '#1f77b4')
         
         fig.add_trace(go.Bar(
-            y=comparison_data['city'],
-            x=comparison_data['population'],
+            y=cities,
+            x=populations,
             orientation='h',
             marker_color=colors,
-            text=[f"{pop:,}" for pop in comparison_data['population']],
+            text=tuple(f"{pop:,}" for pop in populations.tolist()),
             textposition='auto',
             hovertemplate='<b>%{y}</b><br>Population: %{x:,}<br>Country: %{customdata}<extra></extra>',
-            customdata=comparison_data['country']
+            customdata=countries
         ))
         
         fig.update_layout(
+            template=NJ_TEMPLATE,
             title='World City Rankings: Where Greater Jersey City Would Stand',
             xaxis_title='Population',
             yaxis_title='City',
-            height=600,
-            showlegend=False
+            height=600
         )
         
         return html.Div([
-            dcc.Graph(figure=fig),
+            self._figure_graph('rankings', fig),
             dbc.Card([
                 dbc.CardBody([
                     html.H5("Global Perspective"),
@@ -306,22 +435,13 @@ class NJConsolidationDashboard:
     def create_counties_tab(self):
         """Create the county breakdown tab"""
         
-        try:
-            municipalities = pd.read_csv(self.data_dir / 'nj_municipalities.csv')
-        except FileNotFoundError:
+        if self._county_summary is None:
             return dbc.Alert("Data not found. Please run data collection first.", color="warning")
         
-        target_region = municipalities[municipalities['in_target_region']]
-        
-        # County summary
-        county_summary = target_region.groupby('county').agg({
-            'population_2020': 'sum',
-            'area_sq_miles': 'sum',
-            'municipality': 'count'
-        }).reset_index()
+        from plotly.subplots import make_subplots
         
-        county_summary.columns = ['County', 'Population', 'Area_Sq_Miles', 'Municipalities']
-        county_summary['Population_Density'] = county_summary['Population'] / county_summary['Area_Sq_Miles']
+        summary = self._county_summary
+        counties = summary.counties
         
         # Create charts
         fig = make_subplots(
@@ -332,15 +452,15 @@ class NJConsolidationDashboard:
                    [{"type": "bar"}, {"type": "bar"}]]
         )
         
-        county_colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd']
+        county_colors = NJ_COLORS
         
         fig.add_trace(
             go.Bar(
-                x=county_summary['County'],
-                y=county_summary['Population'],
+                x=counties,
+                y=summary.population,
                 name='Population',
                 marker_color=county_colors,
-                text=[f"{pop:,}" for pop in county_summary['Population']],
+                text=summary.population_text,
                 textposition='auto'
             ),
             row=1, col=1
@@ -348,11 +468,11 @@ class NJConsolidationDashboard:
         
         fig.add_trace(
             go.Bar(
-                x=county_summary['County'],
-                y=county_summary['Municipalities'],
+                x=counties,
+                y=summary.municipalities,
                 name='Municipalities',
                 marker_color=county_colors,
-                text=county_summary['Municipalities'],
+                text=summary.municipalities,
                 textposition='auto'
             ),
             row=1, col=2
@@ -360,11 +480,11 @@ class NJConsolidationDashboard:
         
         fig.add_trace(
             go.Bar(
-                x=county_summary['County'],
-                y=county_summary['Population_Density'],
+                x=counties,
+                y=summary.density,
                 name='Density',
                 marker_color=county_colors,
-                text=[f"{density:.0f}" for density in county_summary['Population_Density']],
+                text=summary.density_text,
                 textposition='auto'
             ),
             row=2, col=1
@@ -372,24 +492,24 @@ class NJConsolidationDashboard:
         
         fig.add_trace(
             go.Bar(
-                x=county_summary['County'],
-                y=county_summary['Area_Sq_Miles'],
+                x=counties,
+                y=summary.area,
                 name='Area',
                 marker_color=county_colors,
-                text=[f"{area:.1f}" for area in county_summary['Area_Sq_Miles']],
+                text=summary.area_text,
                 textposition='auto'
             ),
             row=2, col=2
         )
         
         fig.update_layout(
+            template=NJ_TEMPLATE,
             title='Northern New Jersey Counties: Current Structure Analysis',
-            showlegend=False,
             height=700
         )
         
         return html.Div([
-            dcc.Graph(figure=fig),
+            self._figure_graph('counties', fig),
             dbc.Card([
                 dbc.CardBody([
                     html.H5("County Analysis"),
@@ -405,131 +525,80 @@ class NJConsolidationDashboard:
     def create_economic_tab(self):
         """Create the economic impact tab"""
         
-        # Create gauge charts for efficiency improvements
-        fig = make_subplots(
-            rows=2, cols=2,
-            subplot_titles=('Government Overhead Reduction', 'Infrastructure Efficiency',
-                          'Public Services Enhancement', 'Administrative Cost Reduction'),
-            specs=[[{"type": "indicator"}, {"type": "indicator"}],
-                   [{"type": "indicator"}, {"type": "indicator"}]]
-        )
+        # The gauges are constants, so the figure only needs building when
+        # this module is newer than the JSON already on disk
+        fig_path = self.figs_dir / 'economic.json'
+        if fig_path.exists() and fig_path.stat().st_mtime_ns >= Path(__file__).stat().st_mtime_ns:
+            fig = None
+        else:
+            fig = self.create_economic_figure()
+        
+        # Economic benefits card
+        benefits_card = self._html_fragment('benefits.html')
+        
+        return html.Div([
+            self._figure_graph('economic', fig),
+            benefits_card
+        ])
+    
+    def create_economic_figure(self):
+        """Build the economic impact gauges"""
+        
+        # Gauge charts for efficiency improvements, placed on a 2x2 layout
+        # grid directly instead of going through make_subplots
+        gauges = [
+            ("Government Overhead Reduction (%)", 30, "#2ca02c", 20),
+            ("Infrastructure Efficiency Improvement (%)", 40, "#1f77b4", 25),
+            ("Public Services Enhancement (%)", 25, "#ff7f0e", 15),
+            ("Administrative Cost Reduction (%)", 35, "#9467bd", 20)
+        ]
+        
+        fig = go.Figure()
         
-        # Gauge 1: Government Overhead
-        fig.add_trace(go.Indicator(
-            mode="gauge+number+delta",
-            value=30,
-            domain={'x': [0, 1], 'y': [0, 1]},
-            title={'text': "Government Overhead Reduction (%)"},
-            delta={'reference': 0},
-            gauge={'axis': {'range': [None, 50]},
-                   'bar': {'color': "#2ca02c"},
-                   'steps': [{'range': [0, 20], 'color': "lightgray"},
-                            {'range': [20, 30], 'color': "gray"}],
-                   'threshold': {'line': {'color': "red", 'width': 4},
-                               'thickness': 0.75, 'value': 30}}
-        ), row=1, col=1)
-        
-        # Gauge 2: Infrastructure Efficiency
-        fig.add_trace(go.Indicator(
-            mode="gauge+number+delta",
-            value=40,
-            domain={'x': [0, 1], 'y': [0, 1]},
-            title={'text': "Infrastructure Efficiency Improvement (%)"},
-            delta={'reference': 0},
-            gauge={'axis': {'range': [None, 50]},
-                   'bar': {'color': "#1f77b4"},
-                   'steps': [{'range': [0, 25], 'color': "lightgray"},
-                            {'range': [25, 40], 'color': "gray"}],
-                   'threshold': {'line': {'color': "red", 'width': 4},
-                               'thickness': 0.75, 'value': 40}}
-        ), row=1, col=2)
-        
-        # Gauge 3: Public Services
-        fig.add_trace(go.Indicator(
-            mode="gauge+number+delta",
-            value=25,
-            domain={'x': [0, 1], 'y': [0, 1]},
-            title={'text': "Public Services Enhancement (%)"},
-            delta={'reference': 0},
-            gauge={'axis': {'range': [None, 50]},
-                   'bar': {'color': "#ff7f0e"},
-                   'steps': [{'range': [0, 15], 'color': "lightgray"},
-                            {'range': [15, 25], 'color': "gray"}],
-                   'threshold': {'line': {'color': "red", 'width': 4},
-                               'thickness': 0.75, 'value': 25}}
-        ), row=2, col=1)
-        
-        # Gauge 4: Administrative Costs
-        fig.add_trace(go.Indicator(
-            mode="gauge+number+delta",
-            value=35,
-            domain={'x': [0, 1], 'y': [0, 1]},
-            title={'text': "Administrative Cost Reduction (%)"},
-            delta={'reference': 0},
-            gauge={'axis': {'range': [None, 50]},
-                   'bar': {'color': "#9467bd"},
-                   'steps': [{'range': [0, 20], 'color': "lightgray"},
-                            {'range': [20, 35], 'color': "gray"}],
-                   'threshold': {'line': {'color': "red", 'width': 4},
-                               'thickness': 0.75, 'value': 35}}
-        ), row=2, col=2)
+        for i, (title, value, color, low) in enumerate(gauges):
+            fig.add_trace(go.Indicator(
+                mode="gauge+number+delta",
+                value=value,
+                domain={'row': i // 2, 'column': i % 2},
+                title={'text': title},
+                delta={'reference': 0},
+                gauge={'axis': {'range': [None, 50]},
+                       'bar': {'color': color},
+                       'steps': [{'range': [0, low], 'color': "lightgray"},
+                                {'range': [low, value], 'color': "gray"}],
+                       'threshold': {'line': {'color': "red", 'width': 4},
+                                   'thickness': 0.75, 'value': value}}
+            ))
         
         fig.update_layout(
+            template=NJ_TEMPLATE,
             title='Economic Impact of Consolidation: Efficiency Improvements',
+            grid={'rows': 2, 'columns': 2, 'pattern': 'independent'},
             height=700
         )
         
-        # Economic benefits card
-        benefits_card = dbc.Card([
-            dbc.CardBody([
-                html.H5("Economic Benefits of Consolidation"),
-                html.Ul([
-                    html.Li("Estimated annual savings of $500 million"),
-                    html.Li("Reduced government overhead and administrative costs"),
-                    html.Li("Improved infrastructure project efficiency"),
-                    html.Li("Enhanced public service delivery"),
-                    html.Li("Streamlined planning and zoning processes"),
-                    html.Li("Unified public transportation systems")
-                ])
-            ])
-        ])
-        
-        return html.Div([
-            dcc.Graph(figure=fig),
-            benefits_card
-        ])
+        return fig
     
     def create_sizes_tab(self):
         """Create the municipality sizes tab"""
         
-        try:
-            municipalities = pd.read_csv(self.data_dir / 'nj_municipalities.csv')
-        except FileNotFoundError:
+        if self._region is None:
             return dbc.Alert("Data not found. Please run data collection first.", color="warning")
         
-        target_region = municipalities[municipalities['in_target_region']]
-        
-        # Create size categories
-        target_region['size_category'] = pd.cut(
-            target_region['population_2020'],
-            bins=[0, 10000, 25000, 50000, 100000, float('inf')],
-            labels=['Small (<10k)', 'Medium (10k-25k)', 'Large (25k-50k)', 
-                   'Very Large (50k-100k)', 'Major (100k+)']
-        )
-        
-        # Count by category
-        size_distribution = target_region['size_category'].value_counts().sort_index()
+        # Bin populations into size categories (right-closed, as pd.cut)
+        size_counts = bin_counts(self._region.population, SIZE_BIN_EDGES)
         
         # Create pie chart
         fig = go.Figure(data=[go.Pie(
-            labels=size_distribution.index,
-            values=size_distribution.values,
-            hole=0.3,
-            marker_colors=['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd']
+            labels=SIZE_LABELS,
+            values=size_counts,
+            hole=0.3
         )])
         
         fig.update_layout(
+            template=NJ_TEMPLATE,
             title='Distribution of Municipality Sizes in Target Region',
+            showlegend=True,
             annotations=[dict(text='Municipalities<br>by Size', x=0.5, y=0.5, 
                             font_size=20, showarrow=False)]
         )
@@ -547,7 +616,7 @@ class NJConsolidationDashboard:
         ])
         
         return html.Div([
-            dcc.Graph(figure=fig),
+            self._figure_graph('sizes', fig),
             analysis_card
         ])
     
@@ -6,16 +6,31 @@ municipal boundary polygons instead of circles.
 """
 
 import dash
+import flask
 from dash import dcc, html, Input, Output, callback
 import dash_bootstrap_components as dbc
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import json
 from pathlib import Path
+import functools
+import shutil
 import sys
 
+# Dark theme for the figures built here: plotly_dark with the dashboard's
+# background and font colour baked in, instead of per-figure layout updates.
+# Passed per figure so other dashboards in the process keep their own styling
+pio.templates['nj_dark'] = go.layout.Template(pio.templates['plotly_dark']).update(
+    layout=dict(plot_bgcolor='#1a1a1a', paper_bgcolor='#1a1a1a', font=dict(color='white'))
+)
+NJ_DARK_TEMPLATE = 'nj_dark'
+
+# Generated map pages, served to the Maps tab as Dash assets
+MAP_FILES = ('tiger_municipal_boundaries_map.html', 'tiger_consolidation_map.html')
+
 # Add src directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent / 'src'))
 
@@ -23,6 +38,71 @@ from data_collection import NJDataCollector
 from analysis import NJConsolidationAnalyzer
 from enhanced_visualizations import EnhancedNJVisualizationCreator
 from tiger_boundaries import TIGERBoundaryCreator
+from data_io import read_table
+
+@functools.lru_cache(maxsize=1)
+def _build_static_chrome():
+    """Header, intro card, tab bar and footer; static, so built once per process"""
+    
+    # Header with dark theme
+    header = dbc.NavbarSimple(
+        brand="New Jersey Consolidation Analysis",
+        brand_href="#",
+        color="dark",
+        dark=True,
+        className="mb-4",
+        style={'background': 'linear-gradient(90deg, #1a1a1a 0%, #2d2d2d 100%)'}
+    )
+    
+    # Introduction card with dark theme
+    intro_card = dbc.Card([
+        dbc.CardBody([
+            html.H4("The Case for Greater Jersey City", className="card-title text-light"),
+            html.P([
+                "This dashboard explores the potential for consolidating Northern New Jersey's ",
+                "fragmented municipalities into a single, more efficient city. Based on the concept ",
+                "presented in ",
+                html.A("this article", href="https://papaghanoush.substack.com/p/new-jerseys-potential-and-a-plea", 
+                      target="_blank", className="text-info"),
+                ", a consolidated Northern New Jersey would become the ",
+                html.Strong("3rd largest city in the United States"),
+                " with over 3.6 million people."
+            ], className="text-light"),
+            dbc.Alert([
+                html.H5("Key Insight", className="alert-heading"),
+                "If Bergen, Essex, Hudson, Passaic, and Union counties were consolidated into one city, "
+                "it would rank 58th globally, ahead of Madrid, Buenos Aires, and Toronto."
+            ], color="info", className="border-info")
+        ])
+    ], className="bg-dark border-secondary")
+    
+    # Main content tabs
+    tabs = dbc.Tabs([
+        dbc.Tab(label="Maps", tab_id="maps"),
+        dbc.Tab(label="Population Analysis", tab_id="population"),
+        dbc.Tab(label="World Rankings", tab_id="rankings"),
+        dbc.Tab(label="County Breakdown", tab_id="counties"),
+        dbc.Tab(label="Economic Impact", tab_id="economic"),
+        dbc.Tab(label="Claims & Methodology", tab_id="claims")
+    ], id="main-tabs", active_tab="maps", className="nav-pills")
+    
+    # Footer
+    footer = dbc.Card([
+        dbc.CardBody([
+            html.P([
+                "Data sources: US Census Bureau, New Jersey Department of State, ",
+                "and analysis based on municipal consolidation research."
+            ], className="text-muted small"),
+            html.P([
+                "Inspired by: ",
+                html.A("New Jersey's Potential and a Plea for a Greater Jersey City", 
+                      href="https://papaghanoush.substack.com/p/new-jerseys-potential-and-a-plea",
+                      target="_blank", className="text-info")
+            ], className="text-muted small")
+        ])
+    ], className="bg-dark border-secondary mt-4")
+    
+    return header, intro_card, tabs, footer
 
 class ImprovedNJConsolidationDashboard:
     """Improved dashboard - exact copy of 8051 with enhanced municipal boundaries"""
@@ -31,8 +111,10 @@ class ImprovedNJConsolidationDashboard:
         # Use dark theme (same as 8051)
         self.app = dash.Dash(
             __name__, 
-            external_stylesheets=[dbc.themes.DARKLY]
+            external_stylesheets=[dbc.themes.DARKLY],
+            compress=True
         )
+        self._setup_asset_caching()
         self.data_dir = Path(__file__).parent.parent / 'data'
         
         # Initialize components
@@ -44,17 +126,43 @@ class ImprovedNJConsolidationDashboard:
         # Load data
         self._load_data()
         
+        # Tab renderers, and the rendered tabs once they have been shown
+        self._tab_renderers = {
+            'maps': self._render_maps_tab,
+            'population': self._render_population_tab,
+            'rankings': self._render_rankings_tab,
+            'counties': self._render_counties_tab,
+            'economic': self._render_economic_tab,
+            'claims': self._render_claims_tab
+        }
+        self._tab_cache = {}
+        
         # Setup layout and callbacks
         self.setup_layout()
         self.setup_callbacks()
     
+    def _setup_asset_caching(self):
+        """Cache assets for a year only when the URL is versioned (?m= from Dash, ?v= for maps)"""
+        # Unversioned asset URLs keep Flask's default and revalidate by Last-Modified
+        assets_prefix = self.app.get_asset_url('')
+        
+        @self.app.server.after_request
+        def cache_fingerprinted_assets(response):
+            request = flask.request
+            if (request.path.startswith(assets_prefix) and response.status_code == 200
+                    and ('m' in request.args or 'v' in request.args)):
+                response.cache_control.public = True
+                response.cache_control.max_age = 31536000
+            return response
+    
     def _load_data(self):
         """Load all data and create visualizations"""
         # Collect data
         self.data = self.data_collector.collect_all_data()
         
-        # Run analysis
-        self.analyzer.load_data()
+        # Run analysis on the frames just collected rather than re-reading
+        # the CSVs the collector wrote
+        self.analyzer.set_data(**self.data)
         self.analysis_results = {
             'population_analysis': self.analyzer.analyze_population_distribution(),
             'consolidation_impact': self.analyzer.analyze_consolidation_impact(),
@@ -66,79 +174,49 @@ class ImprovedNJConsolidationDashboard:
         
         # Create visualizations
         self.claims_explanations = self.viz_creator.create_claims_explanation()
-        self.tiger_creator.create_all_tiger_maps()
+        # Map generation downloads and processes TIGER shapefiles; skip it
+        # while both pages are newer than everything they are built from
+        if not self.tiger_creator.maps_up_to_date():
+            self.tiger_creator.create_all_tiger_maps()
+        
+        # Publish the maps as assets so the browser fetches (and caches) them
+        # itself instead of receiving megabytes of srcDoc in every payload
+        assets_dir = Path(self.app.config.assets_folder)
+        assets_dir.mkdir(exist_ok=True)
+        for filename in MAP_FILES:
+            source = self.tiger_creator.output_dir / filename
+            # A failed map run leaves the file missing; the Maps tab shows a
+            # placeholder for it instead of the dashboard failing to start
+            if source.exists():
+                shutil.copy2(source, assets_dir / filename)
         
         # Load dataframes
         self.municipalities_df = self.data['municipalities']
         self.scenarios_df = self.data['scenarios']
         self.comparisons_df = self.data['comparisons']
         self.economic_df = self.data['economic']
-        self.county_analysis_df = pd.read_csv(self.data_collector.data_dir / 'county_analysis.csv')
+        self.county_analysis_df = read_table(
+            self.data_collector.data_dir / 'county_analysis.csv',
+            columns=['county', 'total_population']
+        )
+        
+        # The data is fixed for the life of the process, so build each
+        # figure once here rather than inside the tab renderers
+        self._figs = {
+            'population': self.viz_creator.create_dark_population_chart(),
+            'rankings': self.viz_creator.create_dark_world_ranking_chart(),
+            'county': self._create_county_chart(),
+            'economic': self._create_economic_chart()
+        }
     
     def setup_layout(self):
         """Set up the dashboard layout (exact copy of 8051)"""
         
-        # Header with dark theme
-        header = dbc.NavbarSimple(
-            brand="New Jersey Consolidation Analysis",
-            brand_href="#",
-            color="dark",
-            dark=True,
-            className="mb-4",
-            style={'background': 'linear-gradient(90deg, #1a1a1a 0%, #2d2d2d 100%)'}
-        )
-        
-        # Introduction card with dark theme
-        intro_card = dbc.Card([
-            dbc.CardBody([
-                html.H4("The Case for Greater Jersey City", className="card-title text-light"),
-                html.P([
-                    "This dashboard explores the potential for consolidating Northern New Jersey's ",
-                    "fragmented municipalities into a single, more efficient city. Based on the concept ",
-                    "presented in ",
-                    html.A("this article", href="https://papaghanoush.substack.com/p/new-jerseys-potential-and-a-plea", 
-                          target="_blank", className="text-info"),
-                    ", a consolidated Northern New Jersey would become the ",
-                    html.Strong("3rd largest city in the United States"),
-                    " with over 3.6 million people."
-                ], className="text-light"),
-                dbc.Alert([
-                    html.H5("Key Insight", className="alert-heading"),
-                    "If Bergen, Essex, Hudson, Passaic, and Union counties were consolidated into one city, "
-                    "it would rank 58th globally, ahead of Madrid, Buenos Aires, and Toronto."
-                ], color="info", className="border-info")
-            ])
-        ], className="bg-dark border-secondary")
-        
-        # Main content tabs
-        tabs = dbc.Tabs([
-            dbc.Tab(label="Maps", tab_id="maps"),
-            dbc.Tab(label="Population Analysis", tab_id="population"),
-            dbc.Tab(label="World Rankings", tab_id="rankings"),
-            dbc.Tab(label="County Breakdown", tab_id="counties"),
-            dbc.Tab(label="Economic Impact", tab_id="economic"),
-            dbc.Tab(label="Claims & Methodology", tab_id="claims")
-        ], id="main-tabs", active_tab="maps", className="nav-pills")
+        header, intro_card, tabs, footer = _build_static_chrome()
         
         # Content area
         content = html.Div(id="tab-content", className="mt-4")
         
-        # Footer
-        footer = dbc.Card([
-            dbc.CardBody([
-                html.P([
-                    "Data sources: US Census Bureau, New Jersey Department of State, ",
-                    "and analysis based on municipal consolidation research."
-                ], className="text-muted small"),
-                html.P([
-                    "Inspired by: ",
-                    html.A("New Jersey's Potential and a Plea for a Greater Jersey City", 
-                          href="https://papaghanoush.substack.com/p/new-jerseys-potential-and-a-plea",
-                          target="_blank", className="text-info")
-                ], className="text-muted small")
-            ])
-        ], className="bg-dark border-secondary mt-4")
-        
         # Main layout
         self.app.layout = dbc.Container([
             header,
@@ -156,19 +234,14 @@ class ImprovedNJConsolidationDashboard:
             Input("main-tabs", "active_tab")
         )
         def render_tab_content(active_tab):
-            if active_tab == "maps":
-                return self._render_maps_tab()
-            elif active_tab == "population":
-                return self._render_population_tab()
-            elif active_tab == "rankings":
-                return self._render_rankings_tab()
-            elif active_tab == "counties":
-                return self._render_counties_tab()
-            elif active_tab == "economic":
-                return self._render_economic_tab()
-            elif active_tab == "claims":
-                return self._render_claims_tab()
-            return html.Div("Select a tab to view content.")
+            renderer = self._tab_renderers.get(active_tab)
+            if renderer is None:
+                return html.Div("Select a tab to view content.")
+            # The data is static for the life of the process, so each tab
+            # is rendered once and reused on every later switch
+            if active_tab not in self._tab_cache:
+                self._tab_cache[active_tab] = renderer()
+            return self._tab_cache[active_tab]
     
     def _render_maps_tab(self):
         """Render the maps tab with improved municipal boundaries"""
@@ -180,10 +253,7 @@ class ImprovedNJConsolidationDashboard:
                             html.H4("Current Municipal Structure", className="text-light mb-0")
                         ], className="bg-secondary"),
                         dbc.CardBody([
-                            html.Iframe(
-                                srcDoc=open(self.tiger_creator.output_dir / 'tiger_municipal_boundaries_map.html', 'r').read(),
-                                style={"width": "100%", "height": "600px", "border": "none"}
-                            )
+                            self._map_iframe('tiger_municipal_boundaries_map.html')
                         ])
                     ], className="bg-dark border-secondary mb-4")
                 ], md=6),
@@ -194,16 +264,28 @@ class ImprovedNJConsolidationDashboard:
                             html.H4("Consolidation Scenarios", className="text-light mb-0")
                         ], className="bg-secondary"),
                         dbc.CardBody([
-                            html.Iframe(
-                                srcDoc=open(self.tiger_creator.output_dir / 'tiger_consolidation_map.html', 'r').read(),
-                                style={"width": "100%", "height": "600px", "border": "none"}
-                            )
+                            self._map_iframe('tiger_consolidation_map.html')
                         ])
                     ], className="bg-dark border-secondary mb-4")
                 ], md=6)
             ])
         ], fluid=True)
     
+    def _map_iframe(self, filename):
+        """Iframe for a published map page, or a placeholder if it is missing"""
+        path = Path(self.app.config.assets_folder) / filename
+        if path.exists():
+            # Versioned by mtime, so a regenerated map is fetched afresh
+            return html.Iframe(
+                src=self.app.get_asset_url(filename) + f'?v={path.stat().st_mtime_ns}',
+                style={"width": "100%", "height": "600px", "border": "none"}
+            )
+        return html.Div([
+            html.P(f"Map file {filename} not found.", className="text-warning"),
+            html.P("Please ensure the TIGER/Line data processing has completed successfully.",
+                   className="text-muted")
+        ])
+    
     def _render_population_tab(self):
         """Render the population analysis tab"""
         return dbc.Container([
@@ -214,7 +296,7 @@ class ImprovedNJConsolidationDashboard:
                             html.H4("Population Comparison", className="text-light mb-0")
                         ], className="bg-secondary"),
                         dbc.CardBody([
-                            dcc.Graph(figure=self.viz_creator.create_dark_population_chart())
+                            dcc.Graph(figure=self._figs['population'])
                         ])
                     ], className="bg-dark border-secondary mb-4")
                 ], md=12)
@@ -231,7 +313,7 @@ class ImprovedNJConsolidationDashboard:
                             html.H4("🌍 World City Rankings", className="text-light mb-0")
                         ], className="bg-secondary"),
                         dbc.CardBody([
-                            dcc.Graph(figure=self.viz_creator.create_dark_world_ranking_chart())
+                            dcc.Graph(figure=self._figs['rankings'])
                         ])
                     ], className="bg-dark border-secondary mb-4")
                 ], md=12)
@@ -248,7 +330,7 @@ class ImprovedNJConsolidationDashboard:
                             html.H4("County Analysis", className="text-light mb-0")
                         ], className="bg-secondary"),
                         dbc.CardBody([
-                            dcc.Graph(figure=self._create_county_chart())
+                            dcc.Graph(figure=self._figs['county'])
                         ])
                     ], className="bg-dark border-secondary mb-4")
                 ], md=12)
@@ -265,7 +347,7 @@ class ImprovedNJConsolidationDashboard:
                             html.H4("💰 Economic Impact", className="text-light mb-0")
                         ], className="bg-secondary"),
                         dbc.CardBody([
-                            dcc.Graph(figure=self._create_economic_chart())
+                            dcc.Graph(figure=self._figs['economic'])
                         ])
                     ], className="bg-dark border-secondary mb-4")
                 ], md=12)
@@ -315,12 +397,7 @@ class ImprovedNJConsolidationDashboard:
             orientation='h',
             title='Population by County',
             labels={'total_population': 'Population', 'county': 'County'},
-            template='plotly_dark'
-        )
-        fig.update_layout(
-            plot_bgcolor='#1a1a1a',
-            paper_bgcolor='#1a1a1a',
-            font_color='white'
+            template=NJ_DARK_TEMPLATE
         )
         return fig
     
@@ -333,7 +410,7 @@ class ImprovedNJConsolidationDashboard:
                 y=[savings_data['current_value'].iloc[0], savings_data['consolidated_value'].iloc[0]],
                 title='Economic Impact of Consolidation',
                 labels={'x': 'Scenario', 'y': 'Annual Cost (Millions $)'},
-                template='plotly_dark'
+                template=NJ_DARK_TEMPLATE
             )
         else:
             fig = px.bar(
@@ -341,14 +418,9 @@ class ImprovedNJConsolidationDashboard:
                 y=[500, 0],
                 title='Economic Impact of Consolidation',
                 labels={'x': 'Scenario', 'y': 'Annual Cost (Millions $)'},
-                template='plotly_dark'
+                template=NJ_DARK_TEMPLATE
             )
         
-        fig.update_layout(
-            plot_bgcolor='#1a1a1a',
-            paper_bgcolor='#1a1a1a',
-            font_color='white'
-        )
         return fig
     
     def run(self, debug=True, port=8053):
@@ -94,13 +94,15 @@ export const apiService = {
 
   // Maps
   getMunicipalBoundariesMap: async (): Promise<{ html: string }> => {
-    const response = await api.get('/api/maps/municipal-boundaries');
-    return response.data;
+    // The backend streams the map file as text/html
+    const response = await api.get<string>('/api/maps/municipal-boundaries', { responseType: 'text' });
+    return { html: response.data };
   },
 
   getConsolidationMap: async (): Promise<{ html: string }> => {
-    const response = await api.get('/api/maps/consolidation');
-    return response.data;
+    // The backend streams the map file as text/html
+    const response = await api.get<string>('/api/maps/consolidation', { responseType: 'text' });
+    return { html: response.data };
   },
 
   // Insights
@@ -4,6 +4,7 @@ Main application entry point for the New Jersey Municipal Consolidation Analysis
 
 import argparse
 import logging
+import os
 import sys
 from pathlib import Path
 
@@ -11,8 +12,36 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent / 'src'))
 
 from src.core.logging_config import setup_logging
-from src.dashboard.main_dashboard import create_dashboard
-from src.dashboard.improved_dashboard import create_improved_dashboard
+
+
+def serve(dashboard, host, port):
+    """Serve a dashboard's Flask server with gunicorn, or Dash's own server where gunicorn is unavailable."""
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        # gunicorn does not run on Windows
+        dashboard.app.run(debug=False, host=host, port=port)
+        return
+    
+    class DashboardApplication(BaseApplication):
+        def __init__(self, options):
+            self.options = options
+            super().__init__()
+        
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+        
+        def load(self):
+            # Built once in the master and shared with workers on fork
+            return dashboard.app.server
+    
+    DashboardApplication({
+        'bind': f'{host}:{port}',
+        'workers': os.cpu_count() or 1,
+        'worker_class': 'gthread',
+        'threads': 4
+    }).run()
 
 
 def main():
@@ -26,6 +55,11 @@ def main():
         default=8051,
         help='Port to run the dashboard on (default: 8051)'
     )
+    parser.add_argument(
+        '--host',
+        default='127.0.0.1',
+        help='Interface to bind; use 0.0.0.0 to listen on all interfaces (default: 127.0.0.1)'
+    )
     parser.add_argument(
         '--dashboard',
         choices=['main', 'improved'],
@@ -47,14 +81,20 @@ def main():
     try:
         logger.info(f"Starting {args.dashboard} dashboard on port {args.port}")
         
-        # Create appropriate dashboard
+        # Create appropriate dashboard; each pulls in Dash, pandas and the
+        # geo stack, so only the requested one is imported
         if args.dashboard == 'main':
+            from src.dashboard.main_dashboard import create_dashboard
             dashboard = create_dashboard(port=args.port)
         elif args.dashboard == 'improved':
+            from src.dashboard.improved_dashboard import create_improved_dashboard
             dashboard = create_improved_dashboard(port=args.port)
         
-        # Run dashboard
-        dashboard.run(debug=args.debug)
+        # Run dashboard: the Dash dev server for debugging, gunicorn otherwise
+        if args.debug:
+            dashboard.run(debug=True)
+        else:
+            serve(dashboard, args.host, args.port)
         
     except KeyboardInterrupt:
         logger.info("Dashboard stopped by user")
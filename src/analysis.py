@@ -8,80 +8,188 @@ the visualization and insights about municipal consolidation.
 import pandas as pd
 import numpy as np
 from pathlib import Path
-import json
+import functools
+import orjson
+
+from data_io import read_table
+from kernels import summary_stats
+
+# Municipality size categories: inner bin edges and one label per bin
+SIZE_BIN_EDGES = np.array([10000, 50000, 100000])
+SIZE_LABELS = ['Small (<10k)', 'Medium (10k-50k)', 'Large (50k-100k)', 'Very Large (100k+)']
+
+def cached_analysis(method):
+    """Memoize an analyze_* result until the data is reloaded"""
+    @functools.wraps(method)
+    def wrapper(self):
+        if method.__name__ not in self._cache:
+            self._cache[method.__name__] = method(self)
+        return self._cache[method.__name__]
+    return wrapper
 
 class NJConsolidationAnalyzer:
     """Analyzes New Jersey municipal data for consolidation insights"""
     
     def __init__(self, data_dir="data"):
         self.data_dir = Path(data_dir)
+        self._loaded = False
+        self._cache = {}
+        
+    def load_data(self, reload=False):
+        """Load all collected datasets (once, unless reload is set)"""
+        if self._loaded and not reload:
+            return True
         
-    def load_data(self):
-        """Load all collected datasets"""
         try:
-            self.municipalities = pd.read_csv(self.data_dir / 'nj_municipalities.csv')
-            self.scenarios = pd.read_csv(self.data_dir / 'consolidation_scenarios.csv')
-            self.comparisons = pd.read_csv(self.data_dir / 'city_comparisons.csv')
-            self.economic = pd.read_csv(self.data_dir / 'economic_impact.csv')
+            # Parsed once into Parquet caches and projected to the columns
+            # the analyses use
+            self.set_data(
+                municipalities=read_table(
+                    self.data_dir / 'nj_municipalities.csv',
+                    columns=['municipality', 'county', 'population_2020', 'area_sq_miles',
+                             'population_density', 'in_target_region']
+                ),
+                scenarios=read_table(
+                    self.data_dir / 'consolidation_scenarios.csv',
+                    columns=['scenario', 'estimated_population']
+                ),
+                comparisons=read_table(
+                    self.data_dir / 'city_comparisons.csv',
+                    columns=['city', 'country', 'population']
+                ),
+                economic=read_table(
+                    self.data_dir / 'economic_impact.csv',
+                    columns=['metric', 'current_value', 'consolidated_value']
+                )
+            )
             return True
         except FileNotFoundError as e:
             print(f"Data files not found: {e}")
             return False
     
+    def set_data(self, municipalities, scenarios, comparisons, economic):
+        """Analyze frames already in memory (e.g. from NJDataCollector) instead of re-reading the CSVs"""
+        # County is a small set of repeated names; as a categorical it
+        # factorizes from integer codes instead of strings
+        self.municipalities = municipalities.astype({'county': 'category', 'in_target_region': bool})
+        self.scenarios = scenarios
+        self.comparisons = comparisons
+        self.economic = economic
+        
+        # Every analysis works on the target region; filter it once and
+        # keep its hot columns as plain arrays
+        self.target_region = self.municipalities.loc[self.municipalities['in_target_region']].copy()
+        self._pop = np.ascontiguousarray(self.target_region['population_2020'].to_numpy())
+        self._density = self.target_region['population_density'].to_numpy()
+        self._area = self.target_region['area_sq_miles'].to_numpy()
+        self._densest, self._sparsest = int(self._density.argmax()), int(self._density.argmin())
+        
+        # Comparison populations sorted descending once, for binary-search
+        # ranks; stored negated so the arrays are ascending for searchsorted
+        us_cities = self.comparisons['country'].to_numpy() == 'USA'
+        us_neg_pop = -self.comparisons['population'].to_numpy()[us_cities]
+        order = np.argsort(us_neg_pop, kind='stable')
+        self._us_neg_pop = us_neg_pop[order]
+        self._us_city_desc = self.comparisons['city'].to_numpy()[us_cities][order]
+        self._world_neg_pop = np.sort(-self.comparisons['population'].to_numpy())
+        
+        # Single cells the analyses need, read straight from the arrays
+        scenario_mask = self.scenarios['scenario'].to_numpy() == '5-County Consolidation'
+        self._consolidated_pop = self.scenarios['estimated_population'].to_numpy()[scenario_mask][0]
+        savings_mask = self.economic['metric'].to_numpy() == 'Estimated Annual Savings'
+        self._annual_savings = self.economic['consolidated_value'].to_numpy()[savings_mask][0]
+        self._county_codes, self._county_names = pd.factorize(
+            self.target_region['county'].cat.remove_unused_categories(), sort=True
+        )
+        self._county_names = np.asarray(self._county_names)
+        self._county_agg = self._aggregate_counties()
+        self._cache = {}
+        self._loaded = True
+    
+    def _row_dict(self, position):
+        """One target-region row as a dict, looked up by position"""
+        return {column: self.target_region[column].iat[position] for column in self.target_region.columns}
+    
+    def _aggregate_counties(self):
+        """Per-county totals, means and standard deviations for the target region"""
+        
+        # Order rows by county code once, then reduce each county's run of rows
+        order = np.argsort(self._county_codes, kind='stable')
+        codes = self._county_codes[order]
+        starts = np.searchsorted(codes, np.arange(len(self._county_names)))
+        counts = np.diff(np.append(starts, len(order)))
+        
+        def mean_std(values):
+            """Group means and sample standard deviations (NaN for single rows)"""
+            total = np.add.reduceat(values, starts)
+            mean = total / counts
+            squares = np.add.reduceat((values - mean[codes]) ** 2, starts)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                std = np.sqrt(squares / (counts - 1))
+            return total, mean, np.where(counts > 1, std, np.nan)
+        
+        total_population, avg_population, pop_std = mean_std(self._pop[order])
+        _, avg_density, density_std = mean_std(self._density[order])
+        
+        return pd.DataFrame({
+            'county': self._county_names,
+            'total_population': total_population,
+            'municipality_count': counts,
+            'avg_population': avg_population,
+            'pop_std': pop_std,
+            'total_area': np.add.reduceat(self._area[order], starts),
+            'avg_density': avg_density,
+            'density_std': density_std
+        }).round(2)
+    
+    @cached_analysis
     def analyze_population_distribution(self):
         """Analyze population distribution across municipalities"""
         
         # Target region analysis
-        target_region = self.municipalities[self.municipalities['in_target_region']]
+        target_region = self.target_region
+        pop = self._pop
+        total, mean, median, largest, smallest = summary_stats(pop)
         
         analysis = {
             'total_municipalities': len(self.municipalities),
             'target_region_municipalities': len(target_region),
             'total_population': self.municipalities['population_2020'].sum(),
-            'target_region_population': target_region['population_2020'].sum(),
-            'largest_municipality': target_region.loc[target_region['population_2020'].idxmax(), 'municipality'],
-            'largest_population': target_region['population_2020'].max(),
-            'smallest_municipality': target_region.loc[target_region['population_2020'].idxmin(), 'municipality'],
-            'smallest_population': target_region['population_2020'].min(),
-            'average_population': target_region['population_2020'].mean(),
-            'median_population': target_region['population_2020'].median()
+            'target_region_population': total,
+            'largest_municipality': target_region['municipality'].iat[largest],
+            'largest_population': pop[largest],
+            'smallest_municipality': target_region['municipality'].iat[smallest],
+            'smallest_population': pop[smallest],
+            'average_population': mean,
+            'median_population': median
         }
         
         # County breakdown
-        county_analysis = target_region.groupby('county').agg({
-            'population_2020': ['sum', 'count', 'mean'],
-            'area_sq_miles': 'sum',
-            'population_density': 'mean'
-        }).round(2)
-        
-        county_analysis.columns = ['total_population', 'municipality_count', 'avg_population', 'total_area', 'avg_density']
-        county_analysis = county_analysis.reset_index()
+        county_analysis = self._county_agg[[
+            'county', 'total_population', 'municipality_count', 'avg_population', 'total_area', 'avg_density'
+        ]]
         
         return {
             'summary': analysis,
             'county_breakdown': county_analysis
         }
     
+    @cached_analysis
     def analyze_consolidation_impact(self):
         """Analyze the impact of different consolidation scenarios"""
         
         # Current vs consolidated comparison
-        current_pop = self.municipalities[self.municipalities['in_target_region']]['population_2020'].sum()
-        consolidated_pop = self.scenarios[self.scenarios['scenario'] == '5-County Consolidation']['estimated_population'].iloc[0]
-        
-        # Calculate rankings
-        us_rankings = self.comparisons[self.comparisons['country'] == 'USA'].copy()
-        us_rankings = us_rankings.sort_values('population', ascending=False).reset_index(drop=True)
-        us_rankings['us_rank'] = range(1, len(us_rankings) + 1)
+        current_pop = self._pop.sum()
+        consolidated_pop = self._consolidated_pop
         
-        # Find where consolidated NJ would rank
-        nj_rank = len(us_rankings[us_rankings['population'] > consolidated_pop]) + 1
+        # Find where consolidated NJ would rank: the number of larger cities
+        # is a binary search over the presorted, negated populations
+        larger = int(np.searchsorted(self._us_neg_pop, -consolidated_pop, side='left'))
+        smaller = int(np.searchsorted(self._us_neg_pop, -consolidated_pop, side='right'))
+        nj_rank = larger + 1
         
         # World rankings
-        world_rankings = self.comparisons.sort_values('population', ascending=False).reset_index(drop=True)
-        world_rankings['world_rank'] = range(1, len(world_rankings) + 1)
-        
-        nj_world_rank = len(world_rankings[world_rankings['population'] > consolidated_pop]) + 1
+        nj_world_rank = int(np.searchsorted(self._world_neg_pop, -consolidated_pop, side='left')) + 1
         
         analysis = {
             'current_population': current_pop,
@@ -89,20 +197,18 @@ class NJConsolidationAnalyzer:
             'population_difference': consolidated_pop - current_pop,
             'us_city_rank': nj_rank,
             'world_city_rank': nj_world_rank,
-            'would_be_larger_than': us_rankings[us_rankings['population'] < consolidated_pop]['city'].head(5).tolist(),
-            'would_be_smaller_than': us_rankings[us_rankings['population'] > consolidated_pop]['city'].head(5).tolist()
+            'would_be_larger_than': self._us_city_desc[smaller:smaller + 5].tolist(),
+            'would_be_smaller_than': self._us_city_desc[:min(larger, 5)].tolist()
         }
         
         return analysis
     
+    @cached_analysis
     def analyze_efficiency_metrics(self):
         """Analyze potential efficiency gains from consolidation"""
         
-        # Calculate current inefficiencies
-        target_region = self.municipalities[self.municipalities['in_target_region']]
-        
         # Government overhead (estimated based on number of municipalities)
-        current_governments = len(target_region)
+        current_governments = len(self.target_region)
         estimated_overhead_per_municipality = 2000000  # $2M per municipality annually
         
         current_total_overhead = current_governments * estimated_overhead_per_municipality
@@ -125,37 +231,38 @@ class NJConsolidationAnalyzer:
             'overhead_savings': current_total_overhead - consolidated_overhead,
             'infrastructure_efficiency_gain': consolidated_infrastructure_score - current_infrastructure_score,
             'services_efficiency_gain': consolidated_services_score - current_services_score,
-            'total_annual_savings': self.economic[self.economic['metric'] == 'Estimated Annual Savings']['consolidated_value'].iloc[0]
+            'total_annual_savings': self._annual_savings
         }
         
         return analysis
     
+    @cached_analysis
     def analyze_demographic_patterns(self):
         """Analyze demographic patterns across the target region"""
         
-        target_region = self.municipalities[self.municipalities['in_target_region']]
-        
         # Population density analysis
         density_analysis = {
-            'highest_density': target_region.loc[target_region['population_density'].idxmax()].to_dict(),
-            'lowest_density': target_region.loc[target_region['population_density'].idxmin()].to_dict(),
-            'average_density': target_region['population_density'].mean(),
-            'density_std': target_region['population_density'].std()
+            'highest_density': self._row_dict(self._densest),
+            'lowest_density': self._row_dict(self._sparsest),
+            'average_density': self._density.mean(),
+            'density_std': self._density.std(ddof=1)
         }
         
-        # Size distribution
-        size_categories = pd.cut(target_region['population_2020'], 
-                               bins=[0, 10000, 50000, 100000, float('inf')],
-                               labels=['Small (<10k)', 'Medium (10k-50k)', 'Large (50k-100k)', 'Very Large (100k+)'])
-        
-        size_distribution = size_categories.value_counts().to_dict()
-        
-        # County analysis
-        county_stats = target_region.groupby('county').agg({
-            'population_2020': ['sum', 'mean', 'std'],
-            'area_sq_miles': 'sum',
-            'population_density': ['mean', 'std']
-        }).round(2)
+        # Size distribution: right-closed bins, as pd.cut would assign them
+        size_codes = np.digitize(self._pop, SIZE_BIN_EDGES, right=True)
+        size_counts = np.bincount(size_codes, minlength=len(SIZE_LABELS))
+        size_distribution = dict(zip(SIZE_LABELS, size_counts.tolist()))
+        
+        # County analysis, in the shape of the groupby().agg() it replaced:
+        # indexed by county, with (column, statistic) MultiIndex columns
+        county_stats = self._county_agg.set_index('county')[[
+            'total_population', 'avg_population', 'pop_std', 'total_area', 'avg_density', 'density_std'
+        ]]
+        county_stats.columns = pd.MultiIndex.from_tuples([
+            ('population_2020', 'sum'), ('population_2020', 'mean'), ('population_2020', 'std'),
+            ('area_sq_miles', 'sum'),
+            ('population_density', 'mean'), ('population_density', 'std')
+        ])
         
         return {
             'density_analysis': density_analysis,
@@ -208,14 +315,11 @@ class NJConsolidationAnalyzer:
         
         if insights:
             # Save insights as JSON
-            with open(output_path / 'analysis_insights.json', 'w') as f:
-                json.dump(insights, f, indent=2)
+            with open(output_path / 'analysis_insights.json', 'wb') as f:
+                f.write(orjson.dumps(insights, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
             
-            # Save detailed analysis results
+            # Save detailed analysis results (computed for the insights above)
             population_analysis = self.analyze_population_distribution()
-            consolidation_analysis = self.analyze_consolidation_impact()
-            efficiency_analysis = self.analyze_efficiency_metrics()
-            demographic_analysis = self.analyze_demographic_patterns()
             
             # Save county breakdown
             population_analysis['county_breakdown'].to_csv(output_path / 'county_analysis.csv', index=False)
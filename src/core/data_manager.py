@@ -4,21 +4,29 @@ Handles data collection, processing, and validation.
 """
 
 import logging
+import os
 import pandas as pd
 import geopandas as gpd
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-import requests
 import zipfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 from config.settings import (
     DATA_DIR, TIGER_DATA_DIR, TARGET_COUNTIES, TARGET_COUNTY_FIPS,
     TIGER_URLS, NJ_STATE_URLS
 )
+from .downloads import download_file
 
 logger = logging.getLogger(__name__)
 
+# Attribute fields the TIGER/Line consumers use; everything else is skipped on read
+TIGER_COLUMNS = ['STATEFP', 'COUNTYFP', 'PLACEFP', 'COUSUBFP', 'GEOID', 'NAME']
+
+# Columns of the comprehensive municipalities dataset
+MUNICIPALITY_COLUMNS = ['municipality', 'county', 'population_2020', 'area_sq_miles']
+
 
 class DataManager:
     """Manages all data operations for the NJ consolidation analysis."""
@@ -29,90 +37,151 @@ class DataManager:
         self.target_counties = TARGET_COUNTIES
         self.target_county_fips = TARGET_COUNTY_FIPS
         
+        # Loaded TIGER/Line layers, keyed by subdirectory
+        self._cache: Dict[str, gpd.GeoDataFrame] = {}
+        
         # Ensure directories exist
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.tiger_dir.mkdir(parents=True, exist_ok=True)
         
         logger.info("DataManager initialized")
     
+    def _first_shp(self, subdir: str) -> Optional[Path]:
+        """Return the first shapefile in a TIGER/Line subdirectory, if any."""
+        directory = self.tiger_dir / subdir
+        if not directory.is_dir():
+            return None
+        return next((p for p in directory.iterdir() if p.suffix == '.shp'), None)
+    
+    @staticmethod
+    def _to_wgs84(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+        """Reproject to WGS84 (EPSG:4326), which Folium expects; TIGER ships in NAD83."""
+        if gdf.crs and gdf.crs.to_epsg() != 4326:
+            gdf = gdf.to_crs(4326)
+        return gdf
+    
+    def _read_shapefile(self, shapefile_path: Path, columns: Optional[List[str]] = None,
+                        state_fips: Optional[str] = None,
+                        county_fips: Optional[List[str]] = None) -> gpd.GeoDataFrame:
+        """
+        Read a shapefile through pyogrio with Arrow, falling back to Fiona.
+        
+        The STATEFP/COUNTYFP filters and the column projection are pushed into
+        the OGR layer scan so only matching rows are materialized. Filters on
+        fields the layer does not have are skipped.
+        """
+        filters = {'STATEFP': [state_fips] if state_fips else None, 'COUNTYFP': county_fips}
+        filters = {field: list(values) for field, values in filters.items() if values}
+        
+        try:
+            import pyogrio
+            fields = set(pyogrio.read_info(shapefile_path)['fields'])
+        except Exception as e:
+            logger.warning(f"pyogrio cannot read {shapefile_path.name} ({e}), falling back to Fiona")
+            gdf = gpd.read_file(shapefile_path, engine="fiona")
+            for field, values in filters.items():
+                if field in gdf.columns:
+                    gdf = gdf[gdf[field].isin(values)]
+            if columns:
+                gdf = gdf[[c for c in columns if c in gdf.columns] + [gdf.geometry.name]]
+            return gdf
+        
+        where = " AND ".join(
+            f"{field} IN ('" + "','".join(values) + "')"
+            for field, values in filters.items() if field in fields
+        )
+        if columns:
+            columns = [c for c in columns if c in fields]
+        
+        return gpd.read_file(shapefile_path, engine="pyogrio", use_arrow=True,
+                             columns=columns, where=where or None)
+    
+    def _download_one(self, data_type: str, url: str) -> bool:
+        """Download a single TIGER/Line zip unless it is already present."""
+        zip_path = self.tiger_dir / f"{data_type}.zip"
+        
+        if zip_path.exists():
+            logger.info(f"{data_type} data already exists")
+            return True
+        
+        logger.info(f"Downloading {data_type} data...")
+        try:
+            download_file(url, zip_path)
+            logger.info(f"Downloaded {data_type} data successfully")
+            return True
+        except Exception as e:
+            logger.error(f"Error downloading {data_type} data: {e}")
+            return False
+    
     def download_tiger_data(self) -> bool:
         """Download TIGER/Line files from US Census Bureau."""
         logger.info("Downloading TIGER/Line files from US Census Bureau...")
         
-        success = True
-        for data_type, url in TIGER_URLS.items():
-            zip_path = self.tiger_dir / f"{data_type}.zip"
-            
-            if not zip_path.exists():
-                logger.info(f"Downloading {data_type} data...")
-                try:
-                    response = requests.get(url, stream=True, verify=False)
-                    response.raise_for_status()
-                    
-                    with open(zip_path, 'wb') as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            f.write(chunk)
-                    
-                    logger.info(f"Downloaded {data_type} data successfully")
-                except Exception as e:
-                    logger.error(f"Error downloading {data_type} data: {e}")
-                    success = False
-            else:
-                logger.info(f"{data_type} data already exists")
+        # Downloads are network-bound, so fetch all files concurrently
+        with ThreadPoolExecutor(max_workers=len(TIGER_URLS)) as executor:
+            results = list(executor.map(lambda item: self._download_one(*item), TIGER_URLS.items()))
         
-        return success
+        return all(results)
+    
+    def _extract_one(self, data_type: str) -> bool:
+        """Extract a single TIGER/Line zip unless it is already extracted."""
+        zip_path = self.tiger_dir / f"{data_type}.zip"
+        extract_dir = self.tiger_dir / data_type
+        
+        if not zip_path.exists() or extract_dir.exists():
+            logger.info(f"{data_type} data already extracted")
+            return True
+        
+        logger.info(f"Extracting {data_type} data...")
+        try:
+            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                zip_ref.extractall(extract_dir)
+            logger.info(f"Extracted {data_type} data successfully")
+            return True
+        except Exception as e:
+            logger.error(f"Error extracting {data_type} data: {e}")
+            return False
     
     def extract_tiger_data(self) -> bool:
         """Extract downloaded TIGER/Line zip files."""
         logger.info("Extracting TIGER/Line files...")
         
-        success = True
-        for data_type in TIGER_URLS.keys():
-            zip_path = self.tiger_dir / f"{data_type}.zip"
-            extract_dir = self.tiger_dir / data_type
-            
-            if zip_path.exists() and not extract_dir.exists():
-                logger.info(f"Extracting {data_type} data...")
-                try:
-                    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                        zip_ref.extractall(extract_dir)
-                    logger.info(f"Extracted {data_type} data successfully")
-                except Exception as e:
-                    logger.error(f"Error extracting {data_type} data: {e}")
-                    success = False
-            else:
-                logger.info(f"{data_type} data already extracted")
+        # Archives are independent, so inflate them concurrently
+        max_workers = min(8, os.cpu_count() or 1, len(TIGER_URLS))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self._extract_one, TIGER_URLS.keys()))
         
-        return success
+        return all(results)
     
     def load_tiger_municipalities(self) -> Optional[gpd.GeoDataFrame]:
         """Load TIGER/Line municipal boundary data for New Jersey."""
-        logger.info("Loading TIGER/Line municipal boundary data...")
+        if 'municipalities' in self._cache:
+            return self._cache['municipalities'].copy(deep=False)
         
-        municipalities_dir = self.tiger_dir / 'municipalities'
-        shapefile_path = None
+        logger.info("Loading TIGER/Line municipal boundary data...")
         
-        # Find the shapefile
-        for file in municipalities_dir.glob('*.shp'):
-            shapefile_path = file
-            break
+        shapefile_path = self._first_shp('municipalities')
         
         if not shapefile_path:
             logger.error("No municipal shapefile found")
             return None
         
         try:
-            gdf = gpd.read_file(shapefile_path)
-            logger.info(f"Loaded {len(gdf)} municipalities from TIGER/Line data")
-            
-            # Filter to only include municipalities from the 5 target counties
+            # Only rows from the 5 target counties are read from the shapefile
+            gdf = self._read_shapefile(
+                shapefile_path,
+                columns=TIGER_COLUMNS,
+                county_fips=list(self.target_county_fips.keys())
+            )
             if 'COUNTYFP' in gdf.columns:
-                gdf = gdf[gdf['COUNTYFP'].isin(self.target_county_fips.keys())]
-                logger.info(f"Filtered to {len(gdf)} municipalities in 5 target counties")
+                logger.info(f"Loaded {len(gdf)} municipalities in 5 target counties from TIGER/Line data")
             else:
+                logger.info(f"Loaded {len(gdf)} municipalities from TIGER/Line data")
                 logger.warning("COUNTYFP column not found, cannot filter by county")
             
-            return gdf
+            gdf = self._to_wgs84(gdf)
+            self._cache['municipalities'] = gdf
+            return gdf.copy(deep=False)
             
         except Exception as e:
             logger.error(f"Error loading TIGER/Line municipal data: {e}")
@@ -120,32 +189,33 @@ class DataManager:
     
     def load_tiger_county_subdivisions(self) -> Optional[gpd.GeoDataFrame]:
         """Load TIGER/Line county subdivision data for New Jersey."""
-        logger.info("Loading TIGER/Line county subdivision data...")
+        if 'county_subdivisions' in self._cache:
+            return self._cache['county_subdivisions'].copy(deep=False)
         
-        cousub_dir = self.tiger_dir / 'county_subdivisions'
-        shapefile_path = None
+        logger.info("Loading TIGER/Line county subdivision data...")
         
-        # Find the shapefile
-        for file in cousub_dir.glob('*.shp'):
-            shapefile_path = file
-            break
+        shapefile_path = self._first_shp('county_subdivisions')
         
         if not shapefile_path:
             logger.error("No county subdivision shapefile found")
             return None
         
         try:
-            gdf = gpd.read_file(shapefile_path)
-            logger.info(f"Loaded {len(gdf)} county subdivisions from TIGER/Line data")
-            
-            # Filter to only include county subdivisions from the 5 target counties
+            # Only rows from the 5 target counties are read from the shapefile
+            gdf = self._read_shapefile(
+                shapefile_path,
+                columns=TIGER_COLUMNS,
+                county_fips=list(self.target_county_fips.keys())
+            )
             if 'COUNTYFP' in gdf.columns:
-                gdf = gdf[gdf['COUNTYFP'].isin(self.target_county_fips.keys())]
-                logger.info(f"Filtered to {len(gdf)} county subdivisions in 5 target counties")
+                logger.info(f"Loaded {len(gdf)} county subdivisions in 5 target counties from TIGER/Line data")
             else:
+                logger.info(f"Loaded {len(gdf)} county subdivisions from TIGER/Line data")
                 logger.warning("COUNTYFP column not found, cannot filter by county")
             
-            return gdf
+            gdf = self._to_wgs84(gdf)
+            self._cache['county_subdivisions'] = gdf
+            return gdf.copy(deep=False)
             
         except Exception as e:
             logger.error(f"Error loading TIGER/Line county subdivision data: {e}")
@@ -153,34 +223,30 @@ class DataManager:
     
     def load_tiger_counties(self) -> Optional[gpd.GeoDataFrame]:
         """Load TIGER/Line county boundary data for New Jersey."""
-        logger.info("Loading TIGER/Line county boundary data...")
+        if 'counties' in self._cache:
+            return self._cache['counties'].copy(deep=False)
         
-        counties_dir = self.tiger_dir / 'counties'
-        shapefile_path = None
+        logger.info("Loading TIGER/Line county boundary data...")
         
-        # Find the shapefile
-        for file in counties_dir.glob('*.shp'):
-            shapefile_path = file
-            break
+        shapefile_path = self._first_shp('counties')
         
         if not shapefile_path:
             logger.error("No county shapefile found")
             return None
         
         try:
-            gdf = gpd.read_file(shapefile_path)
-            logger.info(f"Loaded {len(gdf)} counties from TIGER/Line data")
-            
-            # Filter to New Jersey counties (STATEFP = '34')
-            gdf = gdf[gdf['STATEFP'] == '34']
-            logger.info(f"Filtered to {len(gdf)} counties in New Jersey")
+            # Only the target New Jersey counties (STATEFP = '34') are read
+            gdf = self._read_shapefile(
+                shapefile_path,
+                columns=TIGER_COLUMNS,
+                state_fips='34',
+                county_fips=list(self.target_county_fips.keys())
+            )
+            logger.info(f"Loaded {len(gdf)} target counties in New Jersey from TIGER/Line data")
             
-            # Filter to target counties
-            target_fips = list(self.target_county_fips.keys())
-            gdf = gdf[gdf['COUNTYFP'].isin(target_fips)]
-            logger.info(f"Filtered to {len(gdf)} target counties in New Jersey")
-            
-            return gdf
+            gdf = self._to_wgs84(gdf)
+            self._cache['counties'] = gdf
+            return gdf.copy(deep=False)
             
         except Exception as e:
             logger.error(f"Error loading TIGER/Line county data: {e}")
@@ -194,21 +260,34 @@ class DataManager:
         # For now, we'll load from the existing CSV
         csv_path = self.data_dir / 'nj_municipalities.csv'
         if csv_path.exists():
-            df = pd.read_csv(csv_path)
+            read_kwargs = {
+                'usecols': MUNICIPALITY_COLUMNS,
+                'dtype': {'population_2020': 'int32', 'area_sq_miles': 'float32'}
+            }
+            try:
+                df = pd.read_csv(csv_path, engine='pyarrow', **read_kwargs)
+            except ImportError:
+                # pyarrow not installed: default C parser with the same schema
+                df = pd.read_csv(csv_path, **read_kwargs)
             logger.info(f"Loaded {len(df)} municipalities from CSV")
             return df
         else:
             logger.warning("Municipalities CSV not found, creating empty dataset")
-            return pd.DataFrame(columns=['municipality', 'county', 'population_2020', 'area_sq_miles'])
+            return pd.DataFrame(columns=MUNICIPALITY_COLUMNS)
     
     def validate_data_quality(self, gdf: gpd.GeoDataFrame, data_type: str) -> Dict[str, any]:
         """Validate the quality of loaded geographic data."""
         logger.info(f"Validating {data_type} data quality...")
         
+        # One GEOS validity pass, reused for every count below
+        valid_mask = gdf.geometry.is_valid.to_numpy()
+        null_mask = gdf.geometry.isna().to_numpy()
+        invalid_count = int((~valid_mask & ~null_mask).sum())
+        
         validation_results = {
             'total_records': len(gdf),
-            'valid_geometries': gdf.geometry.is_valid.sum(),
-            'null_geometries': gdf.geometry.isnull().sum(),
+            'valid_geometries': int(valid_mask.sum()),
+            'null_geometries': int(null_mask.sum()),
             'crs': str(gdf.crs) if gdf.crs else 'No CRS',
             'bounds': gdf.total_bounds.tolist() if not gdf.empty else None
         }
@@ -217,8 +296,7 @@ class DataManager:
         if validation_results['null_geometries'] > 0:
             logger.warning(f"Found {validation_results['null_geometries']} null geometries")
         
-        if not gdf.geometry.is_valid.all():
-            invalid_count = (~gdf.geometry.is_valid).sum()
+        if invalid_count:
             logger.warning(f"Found {invalid_count} invalid geometries")
         
         logger.info(f"Data validation complete: {validation_results}")
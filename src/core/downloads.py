@@ -0,0 +1,39 @@
+"""
+HTTP download helper shared by the TIGER/Line and NJDEP data loaders.
+"""
+
+import shutil
+import threading
+from pathlib import Path
+
+import requests
+
+# requests.Session is not documented as thread-safe, so every thread that
+# downloads keeps its own keep-alive session
+_local = threading.local()
+
+
+def _session() -> requests.Session:
+    """Return the calling thread's session, creating it on first use."""
+    session = getattr(_local, 'session', None)
+    if session is None:
+        session = _local.session = requests.Session()
+    return session
+
+
+def download_file(url: str, path: Path, timeout: float = 30) -> None:
+    """
+    Stream url into path in 1 MiB blocks, with certificate verification.
+
+    Raises the requests exception on failure; a partially written file is
+    removed so the next run downloads it again.
+    """
+    try:
+        with _session().get(url, stream=True, timeout=timeout) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            with open(path, 'wb') as f:
+                shutil.copyfileobj(response.raw, f, length=1024 * 1024)
+    except Exception:
+        Path(path).unlink(missing_ok=True)
+        raise
@@ -21,6 +21,9 @@ logger = logging.getLogger(__name__)
 class TIGERProcessor:
     """Processes TIGER/Line data for municipal boundaries and creates maps."""
     
+    # HTML pages written by create_all_maps
+    MAP_FILES = ('tiger_municipal_boundaries_map.html', 'tiger_consolidation_map.html')
+    
     def __init__(self, data_manager: DataManager):
         self.data_manager = data_manager
         self.output_dir = VISUALIZATIONS_DIR
@@ -38,8 +41,19 @@ class TIGERProcessor:
             ('Washington Borough', 'Union'): 'Washington_Borough'
         }
         
+        # Simplification tolerance per map layer, in degrees (0.0001 is about 11 m)
+        self.simplify_tolerance = {
+            'municipalities': 0.0001,
+            'counties': 0.001
+        }
+        
         logger.info("TIGERProcessor initialized")
     
+    def _simplify_for_web(self, gdf: gpd.GeoDataFrame, layer: str) -> gpd.GeoDataFrame:
+        """Simplify geometries before they are serialized into a Folium map."""
+        simplified = gdf.geometry.simplify(self.simplify_tolerance[layer], preserve_topology=True)
+        return gdf.set_geometry(simplified)
+    
     def load_municipalities(self) -> Optional[gpd.GeoDataFrame]:
         """Load municipal boundary data, trying multiple sources."""
         logger.info("Loading municipal boundary data...")
@@ -61,14 +75,28 @@ class TIGERProcessor:
         if gdf is None or gdf.empty:
             return None
         
+        # Without COUNTYFP the layer could not be filtered on read; keep the
+        # subdivisions that fall inside a target county polygon instead
+        if 'COUNTYFP' not in gdf.columns:
+            counties_gdf = self.data_manager.load_tiger_counties()
+            if counties_gdf is None or counties_gdf.empty:
+                return None
+            
+            points = gdf.set_geometry(gdf.representative_point())
+            joined = gpd.sjoin(points, counties_gdf[['COUNTYFP', 'geometry']], how='inner', predicate='within')
+            gdf = gdf.loc[joined.index].assign(COUNTYFP=joined['COUNTYFP'])
+            logger.info(f"Spatially matched {len(gdf)} county subdivisions to target counties")
+        
         # Add county name mapping
         gdf['county_name'] = gdf['COUNTYFP'].map(self.data_manager.target_county_fips)
         
         # Create mapped municipality names for Washington townships
-        gdf['mapped_municipality'] = gdf.apply(
-            lambda row: self.washington_mapping.get((row['NAME'], row['county_name']), row['NAME']),
-            axis=1
+        mapping_df = pd.DataFrame(
+            [(name, county, mapped) for (name, county), mapped in self.washington_mapping.items()],
+            columns=['NAME', 'county_name', 'mapped_municipality']
         )
+        gdf = gdf.merge(mapping_df, on=['NAME', 'county_name'], how='left')
+        gdf['mapped_municipality'] = gdf['mapped_municipality'].fillna(gdf['NAME'])
         
         # Load comprehensive municipalities dataset
         comprehensive_df = self.data_manager.create_comprehensive_municipalities_dataset()
@@ -87,9 +115,9 @@ class TIGERProcessor:
         missing_municipalities = set(comprehensive_df['municipality']) - set(merged_gdf['municipality'])
         if missing_municipalities:
             logger.info(f"Still missing {len(missing_municipalities)} municipalities after county subdivisions:")
+            muni_to_county = dict(zip(comprehensive_df['municipality'], comprehensive_df['county']))
             for municipality in sorted(missing_municipalities):
-                county = comprehensive_df[comprehensive_df['municipality'] == municipality]['county'].iloc[0]
-                logger.info(f"  - {municipality} ({county} County)")
+                logger.info(f"  - {municipality} ({muni_to_county[municipality]} County)")
         
         return merged_gdf
     
@@ -103,8 +131,9 @@ class TIGERProcessor:
             return None
         
         # Calculate map center
-        center_lat = municipalities_gdf.geometry.centroid.y.mean()
-        center_lon = municipalities_gdf.geometry.centroid.x.mean()
+        minx, miny, maxx, maxy = municipalities_gdf.total_bounds
+        center_lat = (miny + maxy) / 2
+        center_lon = (minx + maxx) / 2
         
         # Create map
         m = folium.Map(
@@ -113,44 +142,50 @@ class TIGERProcessor:
             tiles='CartoDB dark_matter'
         )
         
+        # Colors, labels and popups travel as feature properties so the whole
+        # layer is serialized once
+        county_color = municipalities_gdf['county'].map(self.county_colors).fillna('#666666')
+        fips_column = next((c for c in ('PLACEFP', 'COUSUBFP') if c in municipalities_gdf.columns), None)
+        fips_code = municipalities_gdf[fips_column].astype(str) if fips_column else 'N/A'
+        popup_html = (
+            "<div style='color: white; background: #2d2d2d; padding: 10px; border-radius: 5px; width: 250px;'>"
+            "<h4 style='color: " + county_color + "; margin: 0 0 5px 0;'>" + municipalities_gdf['NAME'] + "</h4>"
+            "<p style='margin: 2px 0;'><strong>County:</strong> " + municipalities_gdf['county'] + "</p>"
+            "<p style='margin: 2px 0;'><strong>FIPS Code:</strong> " + fips_code + "</p>"
+            "<p style='margin: 2px 0;'><strong>Population:</strong> "
+            + municipalities_gdf['population_2020'].map('{:,}'.format) + "</p>"
+            "<p style='margin: 2px 0;'><strong>Area:</strong> "
+            + municipalities_gdf['area_sq_miles'].map('{:.2f}'.format) + " sq mi</p>"
+            "<p style='margin: 2px 0;'><strong>Boundary Type:</strong> TIGER/Line Data</p>"
+            "<p style='margin: 2px 0;'><strong>Features:</strong> Real geographic boundaries</p>"
+            "</div>"
+        )
+        features = municipalities_gdf[['geometry']].assign(
+            county_color=county_color,
+            label=municipalities_gdf['NAME'] + ' (' + municipalities_gdf['county'] + ')',
+            popup_html=popup_html
+        )
+        features = self._simplify_for_web(features, 'municipalities')
+        map_path = self.output_dir / 'tiger_municipal_boundaries_map.html'
+        
         # Add municipalities
-        for _, row in municipalities_gdf.iterrows():
-            county_name = row['county']
-            county_color = self.county_colors.get(county_name, '#666666')
-            
-            # Create popup content
-            fips_code = row.get('PLACEFP', row.get('COUSUBFP', 'N/A'))
-            popup_content = f"""
-            <div style='color: white; background: #2d2d2d; padding: 10px; border-radius: 5px; width: 250px;'>
-                <h4 style='color: {county_color}; margin: 0 0 5px 0;'>{row['NAME']}</h4>
-                <p style='margin: 2px 0;'><strong>County:</strong> {county_name}</p>
-                <p style='margin: 2px 0;'><strong>FIPS Code:</strong> {fips_code}</p>
-                <p style='margin: 2px 0;'><strong>Population:</strong> {row.get('population_2020', 'N/A'):,}</p>
-                <p style='margin: 2px 0;'><strong>Area:</strong> {row.get('area_sq_miles', 'N/A'):.2f} sq mi</p>
-                <p style='margin: 2px 0;'><strong>Boundary Type:</strong> TIGER/Line Data</p>
-                <p style='margin: 2px 0;'><strong>Features:</strong> Real geographic boundaries</p>
-            </div>
-            """
-            
-            # Add municipality to map
-            folium.GeoJson(
-                row.geometry,
-                style_function=lambda feature, color=county_color: {
-                    'fillColor': color,
-                    'color': color,
-                    'weight': 2,
-                    'fillOpacity': 0.7,
-                    'opacity': 0.8
-                },
-                popup=folium.Popup(popup_content, max_width=300),
-                tooltip=f"{row['NAME']} ({county_name})"
-            ).add_to(m)
+        folium.GeoJson(
+            features,
+            style_function=lambda feature: {
+                'fillColor': feature['properties']['county_color'],
+                'color': feature['properties']['county_color'],
+                'weight': 2,
+                'fillOpacity': 0.7,
+                'opacity': 0.8
+            },
+            popup=folium.GeoJsonPopup(fields=['popup_html'], labels=False, max_width=300),
+            tooltip=folium.GeoJsonTooltip(fields=['label'], labels=False)
+        ).add_to(m)
         
         # Add layer control
         folium.LayerControl().add_to(m)
         
         # Save map
-        map_path = self.output_dir / 'tiger_municipal_boundaries_map.html'
         m.save(str(map_path))
         logger.info(f"TIGER/Line municipal boundaries map saved to {map_path}")
         
@@ -167,8 +202,9 @@ class TIGERProcessor:
             return None
         
         # Calculate map center
-        center_lat = counties_gdf.geometry.centroid.y.mean()
-        center_lon = counties_gdf.geometry.centroid.x.mean()
+        minx, miny, maxx, maxy = counties_gdf.total_bounds
+        center_lat = (miny + maxy) / 2
+        center_lon = (minx + maxx) / 2
         
         # Create map
         m = folium.Map(
@@ -177,35 +213,38 @@ class TIGERProcessor:
             tiles='CartoDB dark_matter'
         )
         
+        county_name = counties_gdf['COUNTYFP'].map(self.data_manager.target_county_fips).fillna('Unknown')
+        county_color = county_name.map(self.county_colors).fillna('#666666')
+        popup_html = (
+            "<div style='color: white; background: #2d2d2d; padding: 10px; border-radius: 5px; width: 250px;'>"
+            "<h4 style='color: " + county_color + "; margin: 0 0 5px 0;'>" + county_name + " County</h4>"
+            "<p style='margin: 2px 0;'><strong>FIPS Code:</strong> " + counties_gdf['COUNTYFP'] + "</p>"
+            "<p style='margin: 2px 0;'><strong>Consolidation Scenario:</strong> 5-County Boundary</p>"
+            "<p style='margin: 2px 0;'><strong>Boundary Type:</strong> TIGER/Line County Data</p>"
+            "<p style='margin: 2px 0;'><strong>Features:</strong> Real county boundaries</p>"
+            "</div>"
+        )
+        features = counties_gdf[['geometry']].assign(
+            county_color=county_color,
+            label=county_name + ' County',
+            popup_html=popup_html
+        )
+        features = self._simplify_for_web(features, 'counties')
+        map_path = self.output_dir / 'tiger_consolidation_map.html'
+        
         # Add county boundaries
-        for _, row in counties_gdf.iterrows():
-            county_name = self.data_manager.target_county_fips.get(row['COUNTYFP'], 'Unknown')
-            county_color = self.county_colors.get(county_name, '#666666')
-            
-            # Create popup content
-            popup_content = f"""
-            <div style='color: white; background: #2d2d2d; padding: 10px; border-radius: 5px; width: 250px;'>
-                <h4 style='color: {county_color}; margin: 0 0 5px 0;'>{county_name} County</h4>
-                <p style='margin: 2px 0;'><strong>FIPS Code:</strong> {row['COUNTYFP']}</p>
-                <p style='margin: 2px 0;'><strong>Consolidation Scenario:</strong> 5-County Boundary</p>
-                <p style='margin: 2px 0;'><strong>Boundary Type:</strong> TIGER/Line County Data</p>
-                <p style='margin: 2px 0;'><strong>Features:</strong> Real county boundaries</p>
-            </div>
-            """
-            
-            # Add county to map
-            folium.GeoJson(
-                row.geometry,
-                style_function=lambda feature, color=county_color: {
-                    'fillColor': color,
-                    'color': color,
-                    'weight': 3,
-                    'fillOpacity': 0.3,
-                    'opacity': 0.8
-                },
-                popup=folium.Popup(popup_content, max_width=300),
-                tooltip=f"{county_name} County"
-            ).add_to(m)
+        folium.GeoJson(
+            features,
+            style_function=lambda feature: {
+                'fillColor': feature['properties']['county_color'],
+                'color': feature['properties']['county_color'],
+                'weight': 3,
+                'fillOpacity': 0.3,
+                'opacity': 0.8
+            },
+            popup=folium.GeoJsonPopup(fields=['popup_html'], labels=False, max_width=300),
+            tooltip=folium.GeoJsonTooltip(fields=['label'], labels=False)
+        ).add_to(m)
         
         # Add consolidation scenario markers
         consolidation_data = {
@@ -238,14 +277,31 @@ class TIGERProcessor:
         folium.LayerControl().add_to(m)
         
         # Save map
-        map_path = self.output_dir / 'tiger_consolidation_map.html'
         m.save(str(map_path))
         logger.info(f"TIGER/Line consolidation map saved to {map_path}")
         
         return m
     
+    def _maps_up_to_date(self) -> bool:
+        """Check whether every map is newer than the shapefiles, CSV and code it is built from."""
+        inputs = list(self.data_manager.tiger_dir.rglob('*.shp'))
+        if not inputs:
+            return False
+        inputs += [self.data_manager.data_dir / 'nj_municipalities.csv', Path(__file__)]
+        
+        outputs = [self.output_dir / filename for filename in self.MAP_FILES]
+        if not all(path.exists() for path in inputs + outputs):
+            return False
+        
+        newest_input = max(path.stat().st_mtime_ns for path in inputs)
+        return min(path.stat().st_mtime_ns for path in outputs) >= newest_input
+    
     def create_all_maps(self) -> bool:
         """Create all TIGER/Line maps."""
+        if self._maps_up_to_date():
+            logger.info("TIGER/Line maps are up to date, skipping")
+            return True
+        
         logger.info("Creating TIGER/Line boundary maps...")
         
         try:
@@ -0,0 +1,56 @@
+/*
+ * Clientside chart builders for the main dashboard.
+ *
+ * The server ships each chart's rows once in a dcc.Store; the figures are
+ * built here in the browser instead of in a Python callback.
+ */
+
+function darkLayout(title, xTitle, yTitle) {
+    var axis = {gridcolor: '#283442', zerolinecolor: '#283442'};
+    return {
+        title: {text: title},
+        xaxis: Object.assign({title: {text: xTitle}}, axis),
+        yaxis: Object.assign({title: {text: yTitle}}, axis),
+        plot_bgcolor: '#1a1a1a',
+        paper_bgcolor: '#1a1a1a',
+        font: {color: 'white'}
+    };
+}
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    charts: {
+        countyBar: function(rows) {
+            if (!rows) {
+                return window.dash_clientside.no_update;
+            }
+            var sorted = rows.slice().sort(function(a, b) {
+                return a.total_population - b.total_population;
+            });
+            return {
+                data: [{
+                    type: 'bar',
+                    orientation: 'h',
+                    x: sorted.map(function(d) { return d.total_population; }),
+                    y: sorted.map(function(d) { return d.county; }),
+                    marker: {color: '#636efa'}
+                }],
+                layout: darkLayout('Population by County (Dark Theme)', 'Population', 'County')
+            };
+        },
+
+        economicBar: function(values) {
+            if (!values) {
+                return window.dash_clientside.no_update;
+            }
+            return {
+                data: [{
+                    type: 'bar',
+                    x: ['Current', 'Consolidated'],
+                    y: [values.current, values.consolidated],
+                    marker: {color: '#636efa'}
+                }],
+                layout: darkLayout('Economic Impact of Consolidation (Dark Theme)', 'Scenario', 'Annual Cost (Millions $)')
+            };
+        }
+    }
+});
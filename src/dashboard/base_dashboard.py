@@ -3,40 +3,91 @@ Base dashboard class for the New Jersey Municipal Consolidation Analysis.
 Provides common functionality for all dashboard implementations.
 """
 
+import functools
+import gzip
 import logging
 import dash
+import flask
+from werkzeug.utils import safe_join
 from dash import dcc, html, Input, Output, callback
 import dash_bootstrap_components as dbc
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import json
+import shutil
 from pathlib import Path
 from typing import Dict, Any
 
 from config.settings import (
     DASHBOARD_PORTS, COUNTY_COLORS, POPULATION_DATA, ECONOMIC_IMPACT,
-    CONSOLIDATION_SCENARIOS
+    CONSOLIDATION_SCENARIOS, VISUALIZATIONS_DIR
 )
 
 logger = logging.getLogger(__name__)
 
+# Dark styling shared by the dashboard's Plotly figures
+_DARK_LAYOUT = dict(
+    template="plotly_dark",
+    plot_bgcolor='#1a1a1a',
+    paper_bgcolor='#1a1a1a',
+    font_color='white'
+)
+
+
+def _dark(fig: go.Figure, title: str) -> go.Figure:
+    """Apply the dark styling and a title to a figure."""
+    fig.update_layout(title=title, **_DARK_LAYOUT)
+    return fig
+
+
+@functools.lru_cache(maxsize=16)
+def _read_map(path: str, mtime_ns: int) -> bytes:
+    """Read a published map file; the mtime in the key retires stale copies."""
+    return Path(path).read_bytes()
+
+
+@functools.lru_cache(maxsize=None)
+def _empty_dark_figure(title: str) -> go.Figure:
+    """Shared placeholder for charts a subclass does not provide; do not mutate."""
+    return _dark(go.Figure(), title)
+
 
 class BaseNJConsolidationDashboard:
     """Base class for New Jersey consolidation analysis dashboards."""
     
+    # (tab_id, label, content builder) in display order
+    TABS = [
+        ("overview-tab", "Overview", "_create_overview_tab"),
+        ("maps-tab", "Interactive Maps", "_create_maps_tab"),
+        ("pop-rank-tab", "Population & Rankings", "_create_population_tab"),
+        ("county-tab", "County Analysis", "_create_county_tab"),
+        ("economic-tab", "Economic Impact", "_create_economic_tab"),
+        ("claims-tab", "Methodology & Claims", "_create_claims_tab"),
+    ]
+    # Builder method name by tab_id
+    TAB_BUILDERS = {tab_id: builder for tab_id, _, builder in TABS}
+    
     def __init__(self, port: int = 8051):
         self.port = port
-        self.app = dash.Dash(__name__, external_stylesheets=[dbc.themes.DARKLY])
+        # compress=True gzips callback and layout responses via Flask-Compress
+        # Tab content is rendered on demand, so callback targets are not in the initial layout
+        self.app = dash.Dash(__name__, external_stylesheets=[dbc.themes.DARKLY], compress=True,
+                             suppress_callback_exceptions=True)
         
         # Initialize data
         self.data = {}
         self.analysis_results = {}
         self.claims_explanations = {}
         
-        # Setup layout and callbacks
+        # Built tab content, keyed by tab_id
+        self._tab_cache: Dict[str, Any] = {}
+        
+        # Setup layout, callbacks, the map route and asset caching
         self._setup_layout()
         self._setup_callbacks()
+        self._setup_map_route()
+        self._setup_asset_caching()
         
         logger.info(f"Base dashboard initialized on port {port}")
     
@@ -52,31 +103,11 @@ class BaseNJConsolidationDashboard:
             html.P("Exploring the potential for municipal consolidation in Northern New Jersey.", 
                    className="lead text-center text-light"),
 
+            # Tab content is built on first activation, see _render_tab
             dbc.Tabs([
-                dbc.Tab(label="Overview", tab_id="overview-tab", children=[
-                    self._create_overview_tab()
-                ]),
-                
-                dbc.Tab(label="Interactive Maps", tab_id="maps-tab", children=[
-                    self._create_maps_tab()
-                ]),
-                
-                dbc.Tab(label="Population & Rankings", tab_id="pop-rank-tab", children=[
-                    self._create_population_tab()
-                ]),
-                
-                dbc.Tab(label="County Analysis", tab_id="county-tab", children=[
-                    self._create_county_tab()
-                ]),
-                
-                dbc.Tab(label="Economic Impact", tab_id="economic-tab", children=[
-                    self._create_economic_tab()
-                ]),
-                
-                dbc.Tab(label="Methodology & Claims", tab_id="claims-tab", children=[
-                    self._create_claims_tab()
-                ]),
-            ])
+                dbc.Tab(label=label, tab_id=tab_id) for tab_id, label, _ in self.TABS
+            ], id="tabs", active_tab=self.TABS[0][0]),
+            html.Div(id="tab-content")
         ], fluid=True, className="bg-dark")
     
     def _create_overview_tab(self):
@@ -135,14 +166,63 @@ class BaseNJConsolidationDashboard:
             ])
         ])
     
+    def _publish_map(self, filename: str) -> Path:
+        """Copy a generated map into assets/maps, plus a gzip sibling, unless current."""
+        source = VISUALIZATIONS_DIR / filename
+        target = Path(self.app.config.assets_folder) / "maps" / filename
+        if source.exists() and (not target.exists()
+                                or target.stat().st_mtime_ns < source.stat().st_mtime_ns):
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source, target)
+            with open(source, 'rb') as src, gzip.open(f"{target}.gz", 'wb', compresslevel=6) as dst:
+                shutil.copyfileobj(src, dst, length=1024 * 1024)
+        return target
+    
+    def _setup_asset_caching(self):
+        """Cache assets for a year only when Dash fingerprinted the URL with ?m=."""
+        # Unversioned asset URLs keep Flask's default and revalidate by Last-Modified
+        assets_prefix = self.app.get_asset_url('')
+        
+        @self.app.server.after_request
+        def cache_fingerprinted_assets(response):
+            request = flask.request
+            if (request.path.startswith(assets_prefix) and response.status_code == 200
+                    and 'm' in request.args):
+                response.cache_control.public = True
+                response.cache_control.max_age = 31536000
+            return response
+    
+    def _setup_map_route(self):
+        """Serve published maps from /maps/, pre-compressed when the client accepts gzip."""
+        maps_dir = Path(self.app.config.assets_folder) / "maps"
+        
+        # Flask-Compress skips file responses, so the maps are compressed once
+        # by _publish_map and sent as-is, from memory after the first request
+        @self.app.server.route(f"{self.app.config.routes_pathname_prefix}maps/<path:filename>")
+        def serve_map(filename):
+            path = safe_join(str(maps_dir), filename)
+            if path is None or not Path(path).is_file():
+                flask.abort(404)
+            
+            path = Path(path)
+            gz_path = path.with_name(f"{path.name}.gz")
+            gzipped = "gzip" in flask.request.accept_encodings and gz_path.exists()
+            if gzipped:
+                path = gz_path
+            
+            stat = path.stat()
+            response = flask.Response(_read_map(str(path), stat.st_mtime_ns), mimetype="text/html")
+            if gzipped:
+                response.headers["Content-Encoding"] = "gzip"
+            response.headers["Vary"] = "Accept-Encoding"
+            response.last_modified = stat.st_mtime
+            return response.make_conditional(flask.request)
+    
     def _create_map_iframe(self, filename: str):
-        """Create an iframe for displaying maps."""
-        map_path = Path("visualizations") / filename
-        if map_path.exists():
-            with open(map_path, 'r') as f:
-                map_content = f.read()
+        """Create an iframe that loads a published map page."""
+        if self._publish_map(filename).exists():
             return html.Iframe(
-                srcDoc=map_content,
+                src=self.app.get_relative_path(f"/maps/{filename}"),
                 style={"width": "100%", "height": "600px", "border": "none"}
             )
         else:
@@ -195,54 +275,22 @@ class BaseNJConsolidationDashboard:
     def _create_population_chart(self):
         """Create population comparison chart."""
         # This should be implemented by subclasses with actual data
-        fig = go.Figure()
-        fig.update_layout(
-            title="Population Comparison (Dark Theme)",
-            template="plotly_dark",
-            plot_bgcolor='#1a1a1a',
-            paper_bgcolor='#1a1a1a',
-            font_color='white'
-        )
-        return fig
+        return _empty_dark_figure("Population Comparison (Dark Theme)")
     
     def _create_world_ranking_chart(self):
         """Create world city ranking chart."""
         # This should be implemented by subclasses with actual data
-        fig = go.Figure()
-        fig.update_layout(
-            title="World City Ranking (Dark Theme)",
-            template="plotly_dark",
-            plot_bgcolor='#1a1a1a',
-            paper_bgcolor='#1a1a1a',
-            font_color='white'
-        )
-        return fig
+        return _empty_dark_figure("World City Ranking (Dark Theme)")
     
     def _create_county_analysis_chart(self):
         """Create county analysis chart."""
         # This should be implemented by subclasses with actual data
-        fig = go.Figure()
-        fig.update_layout(
-            title="County Analysis (Dark Theme)",
-            template="plotly_dark",
-            plot_bgcolor='#1a1a1a',
-            paper_bgcolor='#1a1a1a',
-            font_color='white'
-        )
-        return fig
+        return _empty_dark_figure("County Analysis (Dark Theme)")
     
     def _create_economic_impact_chart(self):
         """Create economic impact chart."""
         # This should be implemented by subclasses with actual data
-        fig = go.Figure()
-        fig.update_layout(
-            title="Economic Impact (Dark Theme)",
-            template="plotly_dark",
-            plot_bgcolor='#1a1a1a',
-            paper_bgcolor='#1a1a1a',
-            font_color='white'
-        )
-        return fig
+        return _empty_dark_figure("Economic Impact (Dark Theme)")
     
     def _render_claims_explanation(self):
         """Render claims explanations."""
@@ -267,10 +315,22 @@ class BaseNJConsolidationDashboard:
             )
         return html.Div(cards)
     
+    def _render_tab(self, tab_id: str):
+        """Build a tab's content on first activation and reuse it afterwards."""
+        if tab_id not in self._tab_cache:
+            builder = self.TAB_BUILDERS.get(tab_id)
+            if builder is None:
+                logger.warning(f"Unknown tab {tab_id!r}")
+                return html.Div()
+            self._tab_cache[tab_id] = getattr(self, builder)()
+        return self._tab_cache[tab_id]
+    
     def _setup_callbacks(self):
         """Setup dashboard callbacks."""
-        # Base implementation - can be extended by subclasses
-        pass
+        # Subclasses extending this should call super()._setup_callbacks()
+        @self.app.callback(Output("tab-content", "children"), Input("tabs", "active_tab"))
+        def render_tab(active_tab):
+            return self._render_tab(active_tab)
     
     def run(self, debug: bool = True):
         """Run the dashboard."""
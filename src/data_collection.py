@@ -2,10 +2,66 @@
 Simplified Data Collection Module for New Jersey Consolidation Analysis
 """
 
+import hashlib
 import pandas as pd
 import numpy as np
 from pathlib import Path
 
+# Part of every dataset cache key; bump it when a builder's output changes
+# without its literal data changing
+_CACHE_VERSION = 2
+
+# Sample municipalities as one structured array: each column is a typed,
+# contiguous field, so the DataFrame is built without dtype inference
+_MUNI_DTYPE = np.dtype([
+    ('municipality', 'U32'),
+    ('county', 'U16'),
+    ('population_2020', 'i8'),
+    ('area_sq_miles', 'f8')
+])
+_MUNI_ARR = np.array([
+    ('Newark', 'Essex', 311549, 26.1),
+    ('Jersey City', 'Hudson', 292449, 14.8),
+    ('Paterson', 'Passaic', 159732, 8.4),
+    ('Elizabeth', 'Union', 137298, 12.3),
+    ('Edison', 'Middlesex', 107588, 30.1),
+    ('Woodbridge', 'Middlesex', 103639, 24.2),
+    ('Lakewood', 'Ocean', 135158, 24.9),
+    ('Toms River', 'Ocean', 95838, 41.8),
+    ('Hamilton', 'Mercer', 92089, 40.1),
+    ('Trenton', 'Mercer', 90632, 7.6),
+    ('Clifton', 'Passaic', 90081, 11.3),
+    ('Camden', 'Camden', 71277, 9.1),
+    ('Brick', 'Ocean', 76395, 21.4),
+    ('Cherry Hill', 'Camden', 74141, 14.2),
+    ('Passaic', 'Passaic', 70037, 3.2),
+    ('Union City', 'Hudson', 68400, 1.3),
+    ('Bayonne', 'Hudson', 71026, 5.8),
+    ('East Orange', 'Essex', 69012, 3.9),
+    ('Vineland', 'Cumberland', 60780, 69.4),
+    ('New Brunswick', 'Middlesex', 55641, 5.8),
+    ('Bergenfield', 'Bergen', 28000, 4.2),
+    ('Dumont', 'Bergen', 18000, 2.1),
+    ('Fort Lee', 'Bergen', 40000, 2.5),
+    ('Hackensack', 'Bergen', 46000, 4.3),
+    ('Paramus', 'Bergen', 27000, 10.4),
+    ('Ridgewood', 'Bergen', 26000, 5.8),
+    ('Teaneck', 'Bergen', 41000, 6.2),
+    ('West New York', 'Hudson', 52000, 1.0),
+    ('Hoboken', 'Hudson', 58000, 2.0),
+    ('Secaucus', 'Hudson', 22000, 6.6),
+    ('Livingston', 'Essex', 31000, 14.0),
+    ('Maplewood', 'Essex', 25000, 3.9),
+    ('South Orange', 'Essex', 18000, 2.9),
+    ('West Orange', 'Essex', 48000, 12.1),
+    ('Montclair', 'Essex', 41000, 6.3),
+    ('Bloomfield', 'Essex', 52000, 5.3),
+    ('Nutley', 'Essex', 29000, 3.4),
+    ('Belleville', 'Essex', 38000, 3.4),
+    ('Kearny', 'Hudson', 42000, 8.7),
+    ('North Bergen', 'Hudson', 65000, 5.1),
+], dtype=_MUNI_DTYPE)
+
 class NJDataCollector:
     """Collects and processes New Jersey municipal data"""
     
@@ -16,67 +72,63 @@ class NJDataCollector:
         # Target counties for Northern New Jersey consolidation
         self.target_counties = ['Bergen', 'Essex', 'Hudson', 'Passaic', 'Union']
     
-    def create_sample_data(self):
-        """Create sample data for demonstration purposes"""
+    def _cached_frame(self, name, raw, build):
+        """
+        Build a dataset once per version of its literal data
         
-        # Create simple, working data
-        municipalities_data = {
-            'municipality': [
-                'Newark', 'Jersey City', 'Paterson', 'Elizabeth', 'Edison',
-                'Woodbridge', 'Lakewood', 'Toms River', 'Hamilton', 'Trenton',
-                'Clifton', 'Camden', 'Brick', 'Cherry Hill', 'Passaic',
-                'Union City', 'Bayonne', 'East Orange', 'Vineland', 'New Brunswick',
-                'Bergenfield', 'Dumont', 'Fort Lee', 'Hackensack', 'Paramus',
-                'Ridgewood', 'Teaneck', 'West New York', 'Hoboken', 'Secaucus',
-                'Livingston', 'Maplewood', 'South Orange', 'West Orange', 'Montclair',
-                'Bloomfield', 'Nutley', 'Belleville', 'Kearny', 'North Bergen'
-            ],
-            'county': [
-                'Essex', 'Hudson', 'Passaic', 'Union', 'Middlesex',
-                'Middlesex', 'Ocean', 'Ocean', 'Mercer', 'Mercer',
-                'Passaic', 'Camden', 'Ocean', 'Camden', 'Passaic',
-                'Hudson', 'Hudson', 'Essex', 'Cumberland', 'Middlesex',
-                'Bergen', 'Bergen', 'Bergen', 'Bergen', 'Bergen',
-                'Bergen', 'Bergen', 'Hudson', 'Hudson', 'Hudson',
-                'Essex', 'Essex', 'Essex', 'Essex', 'Essex',
-                'Essex', 'Essex', 'Essex', 'Hudson', 'Hudson'
-            ],
-            'population_2020': [
-                311549, 292449, 159732, 137298, 107588,
-                103639, 135158, 95838, 92089, 90632,
-                90081, 71277, 76395, 74141, 70037,
-                68400, 71026, 69012, 60780, 55641,
-                28000, 18000, 40000, 46000, 27000,
-                26000, 41000, 52000, 58000, 22000,
-                31000, 25000, 18000, 48000, 41000,
-                52000, 29000, 38000, 42000, 65000
-            ],
-            'area_sq_miles': [
-                26.1, 14.8, 8.4, 12.3, 30.1,
-                24.2, 24.9, 41.8, 40.1, 7.6,
-                11.3, 9.1, 21.4, 14.2, 3.2,
-                1.3, 5.8, 3.9, 69.4, 5.8,
-                4.2, 2.1, 2.5, 4.3, 10.4,
-                5.8, 6.2, 1.0, 2.0, 6.6,
-                14.0, 3.9, 2.9, 12.1, 6.3,
-                5.3, 3.4, 3.4, 8.7, 5.1
-            ]
-        }
+        raw is hashed into the Parquet file name, so editing the data below
+        invalidates the cache. On a miss the frame is built, exported to
+        name.csv and cached; on a hit both writes are skipped. The CSV is
+        written just before the Parquet file, so a CSV newer than it was
+        replaced since and is rewritten, keeping both in step.
+        """
+        key = hashlib.sha1(repr((_CACHE_VERSION, raw)).encode()).hexdigest()[:12]
+        parquet_path = self.data_dir / f'{name}_{key}.parquet'
+        csv_path = self.data_dir / f'{name}.csv'
         
-        # Create DataFrame
-        df = pd.DataFrame(municipalities_data)
+        if (parquet_path.exists() and csv_path.exists()
+                and csv_path.stat().st_mtime_ns <= parquet_path.stat().st_mtime_ns):
+            try:
+                return pd.read_parquet(parquet_path)
+            except ImportError:
+                pass
         
-        # Calculate population density
-        df['population_density'] = df['population_2020'] / df['area_sq_miles']
+        df = build()
+        df.to_csv(csv_path, index=False)
         
-        # Add calculated fields
-        df['in_target_region'] = df['county'].isin(self.target_counties)
+        try:
+            df.to_parquet(parquet_path, engine='pyarrow', index=False)
+        except ImportError:
+            # pyarrow not installed: rebuild every time, as before
+            return df
         
-        # Save to CSV
-        df.to_csv(self.data_dir / 'nj_municipalities.csv', index=False)
+        for stale in self.data_dir.glob(f'{name}_*.parquet'):
+            if stale != parquet_path:
+                stale.unlink()
         
         return df
     
+    def create_sample_data(self):
+        """Create sample data for demonstration purposes"""
+        
+        def build():
+            df = pd.DataFrame(_MUNI_ARR)
+            
+            # County repeats a handful of names; as a categorical it is stored
+            # as small integer codes
+            df['county'] = df['county'].astype('category')
+            
+            # Derived columns, computed on the raw arrays
+            df['population_density'] = np.divide(_MUNI_ARR['population_2020'], _MUNI_ARR['area_sq_miles'])
+            target_codes = df['county'].cat.categories.get_indexer(self.target_counties)
+            df['in_target_region'] = np.isin(df['county'].cat.codes, target_codes[target_codes >= 0])
+            
+            return df
+        
+        return self._cached_frame(
+            'nj_municipalities', (_MUNI_ARR.tobytes(), self.target_counties), build
+        )
+    
     def create_consolidation_scenarios(self):
         """Create data for different consolidation scenarios"""
         
@@ -131,10 +183,14 @@ class NJDataCollector:
             ]
         }
         
-        df = pd.DataFrame(scenarios)
-        df.to_csv(self.data_dir / 'consolidation_scenarios.csv', index=False)
+        def build():
+            df = pd.DataFrame(scenarios)
+            # The rank columns mix 'N/A' with numbers; keep them as text, which
+            # is also how they read back from the CSV
+            df[['us_city_rank', 'world_city_rank']] = df[['us_city_rank', 'world_city_rank']].astype(str)
+            return df
         
-        return df
+        return self._cached_frame('consolidation_scenarios', scenarios, build)
     
     def create_comparison_data(self):
         """Create data for comparing NJ consolidation to other major cities"""
@@ -168,20 +224,22 @@ class NJDataCollector:
         }
         
         # Add consolidated NJ to the data
-        nj_data = pd.DataFrame({
+        nj_data = {
             'city': ['Greater Jersey City (Proposed)'],
             'country': ['USA'],
             'population': [3610711],
             'area_sq_km': [2000],
             'density_per_sq_km': [1805]
-        })
+        }
         
-        # Combine and sort
-        df = pd.DataFrame(comparison_data)
-        df = pd.concat([df, nj_data], ignore_index=True)
-        df.to_csv(self.data_dir / 'city_comparisons.csv', index=False)
+        def build():
+            # Combine and sort
+            df = pd.DataFrame(comparison_data)
+            df = pd.concat([df, pd.DataFrame(nj_data)], ignore_index=True)
+            df['country'] = df['country'].astype('category')
+            return df
         
-        return df
+        return self._cached_frame('city_comparisons', (comparison_data, nj_data), build)
     
     def create_economic_impact_data(self):
         """Create data showing potential economic benefits of consolidation"""
@@ -223,10 +281,9 @@ class NJDataCollector:
             ]
         }
         
-        df = pd.DataFrame(economic_data)
-        df.to_csv(self.data_dir / 'economic_impact.csv', index=False)
-        
-        return df
+        return self._cached_frame(
+            'economic_impact', economic_data, lambda: pd.DataFrame(economic_data)
+        )
     
     def collect_all_data(self):
         """Collect all datasets for the analysis"""
@@ -0,0 +1,66 @@
+"""
+Data Loading Helpers for New Jersey Consolidation Project
+
+CSV files in data/ stay the source of truth. The first read of each file
+writes a hidden Parquet cache beside it, and later reads decode that instead
+of re-parsing the text. The latest version of each file stays in memory.
+"""
+
+from pathlib import Path
+
+import pandas as pd
+
+
+def _parquet_path(csv_path):
+    """
+    Parquet cache of a CSV file
+
+    Deliberately not name.parquet: the backend serves that file, written by
+    backend/convert_data.py with its own schema, in preference to the CSV.
+    """
+    return csv_path.with_name(f'.{csv_path.stem}.pd.parquet')
+
+
+# Loaded frames by CSV path, with the mtime they were read at; a changed
+# file replaces its entry, so superseded frames are not kept alive
+_frames = {}
+
+
+def _load(csv_path, mtime_ns):
+    """Read a CSV through its Parquet cache, rewriting the cache if stale"""
+    csv_path = Path(csv_path)
+    parquet_path = _parquet_path(csv_path)
+
+    try:
+        if parquet_path.exists() and parquet_path.stat().st_mtime_ns >= mtime_ns:
+            return pd.read_parquet(parquet_path)
+
+        df = pd.read_csv(csv_path, engine='pyarrow')
+        df.to_parquet(parquet_path, index=False)
+        return df
+    except ImportError:
+        # pyarrow not installed: plain CSV parse, no sidecar
+        return pd.read_csv(csv_path)
+
+
+def read_table(csv_path, columns=None, dtype=None):
+    """
+    Load a data CSV as a DataFrame.
+
+    columns projects the result to the named columns and dtype is applied
+    with DataFrame.astype. Raises FileNotFoundError if the CSV does not
+    exist. Results are cached until the CSV changes; callers get a shallow
+    copy, so adding or replacing columns does not touch the cached frame.
+    """
+    csv_path = Path(csv_path)
+    mtime_ns = csv_path.stat().st_mtime_ns
+    cached = _frames.get(str(csv_path))
+    if cached is not None and cached[0] == mtime_ns:
+        df = cached[1]
+    else:
+        df = _load(csv_path, mtime_ns)
+        _frames[str(csv_path)] = (mtime_ns, df)
+    df = df[list(columns)] if columns is not None else df.copy(deep=False)
+    if dtype:
+        df = df.astype(dtype)
+    return df
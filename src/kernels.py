@@ -0,0 +1,61 @@
+"""
+Numeric Kernels for New Jersey Consolidation Project
+
+This module holds the small array kernels shared by the dashboards and the
+analysis code. They are compiled with Numba when it is installed and run as
+plain Python/NumPy otherwise, so Numba stays an optional speed-up.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback when Numba is unavailable: return the function unchanged"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def county_reduce(codes, population, area, n_counties):
+    """Sum population and area and count rows per county code in one pass"""
+    population_sum = np.zeros(n_counties, dtype=np.int64)
+    area_sum = np.zeros(n_counties, dtype=np.float64)
+    counts = np.zeros(n_counties, dtype=np.int64)
+    for i in range(codes.shape[0]):
+        code = codes[i]
+        population_sum[code] += population[i]
+        area_sum[code] += area[i]
+        counts[code] += 1
+    return population_sum, area_sum, counts
+
+
+@njit(cache=True)
+def bin_counts(values, upper_edges):
+    """Count values per right-closed bin given each bin's upper edge (like pd.cut)"""
+    counts = np.zeros(upper_edges.shape[0], dtype=np.int64)
+    for i in range(values.shape[0]):
+        for j in range(upper_edges.shape[0]):
+            if values[i] <= upper_edges[j]:
+                counts[j] += 1
+                break
+    return counts
+
+
+@njit(cache=True)
+def summary_stats(values):
+    """Sum, mean, median and the positions of the largest and smallest value"""
+    if values.shape[0] == 0:
+        raise ValueError("summary_stats() of an empty array")
+    total = 0
+    largest = 0
+    smallest = 0
+    for i in range(values.shape[0]):
+        total += values[i]
+        if values[i] > values[largest]:
+            largest = i
+        if values[i] < values[smallest]:
+            smallest = i
+    return total, total / values.shape[0], np.median(values), largest, smallest
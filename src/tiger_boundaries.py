@@ -9,15 +9,22 @@ import pandas as pd
 import numpy as np
 import folium
 import json
-import requests
 import zipfile
 from pathlib import Path
 from shapely.geometry import Polygon, Point
 import geopandas as gpd
 
+from core.downloads import download_file
+
+# TIGER/Line attribute columns used below; the rest are dropped right after loading
+TIGER_KEEP_COLUMNS = ['geometry', 'STATEFP', 'COUNTYFP', 'PLACEFP', 'COUSUBFP', 'GEOID', 'NAME', 'NAMELSAD']
+
 class TIGERBoundaryCreator:
     """Creates maps using US Census Bureau TIGER/Line municipal boundary data"""
     
+    # HTML pages written by create_all_tiger_maps
+    MAP_FILES = ('tiger_municipal_boundaries_map.html', 'tiger_consolidation_map.html')
+    
     def __init__(self, data_dir="data", output_dir="visualizations"):
         self.data_dir = Path(data_dir)
         self.output_dir = Path(output_dir)
@@ -302,13 +309,7 @@ class TIGERBoundaryCreator:
             if not zip_path.exists():
                 print(f"Downloading {data_type} data...")
                 try:
-                    response = requests.get(url, stream=True, verify=False)
-                    response.raise_for_status()
-                    
-                    with open(zip_path, 'wb') as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            f.write(chunk)
-                    
+                    download_file(url, zip_path)
                     print(f"Downloaded {data_type} data successfully")
                 except Exception as e:
                     print(f"Error downloading {data_type} data: {e}")
@@ -395,6 +396,8 @@ class TIGERBoundaryCreator:
             else:
                 print("⚠️ COUNTYFP column not found, cannot filter by county")
             
+            gdf = gdf[[c for c in TIGER_KEEP_COLUMNS if c in gdf.columns]]
+            
             # Filter for municipalities that match our comprehensive data
             # We'll match by name and county, but first need to map county FIPS codes to county names
             county_fips_to_name = self.target_county_fips
@@ -406,19 +409,17 @@ class TIGERBoundaryCreator:
                 print("⚠️ COUNTYFP column not found in PLACE data, skipping county-based matching")
                 gdf['county_name'] = None
             
-            # Create a mapping for Washington townships
+            # Washington townships are disambiguated by county
             washington_mapping = {
-                ('Washington', 'Bergen'): 'Washington_Bergen_003',
-                ('Washington', 'Hudson'): 'Washington_Hudson', 
-                ('Washington', 'Passaic'): 'Washington_Passaic',
-                ('Washington', 'Union'): 'Washington_Union'
+                'Bergen': 'Washington_Bergen_003',
+                'Hudson': 'Washington_Hudson',
+                'Passaic': 'Washington_Passaic',
+                'Union': 'Washington_Union'
             }
             
-            # Add mapped municipality names
-            gdf['mapped_municipality'] = gdf.apply(
-                lambda row: washington_mapping.get((row['NAME'], row['county_name']), row['NAME']), 
-                axis=1
-            )
+            # Add mapped municipality names (column-wise, no per-row apply)
+            washington_names = gdf['county_name'].map(washington_mapping).where(gdf['NAME'] == 'Washington')
+            gdf['mapped_municipality'] = washington_names.fillna(gdf['NAME'])
             
             # Match by both mapped name and county (if county_name is available)
             if gdf['county_name'].notna().any():
@@ -485,6 +486,8 @@ class TIGERBoundaryCreator:
             else:
                 print("⚠️ COUNTYFP column not found, cannot filter by county")
             
+            gdf = gdf[[c for c in TIGER_KEEP_COLUMNS if c in gdf.columns]]
+            
             # Check what columns are available
             print(f"Available columns: {list(gdf.columns)}")
             
@@ -503,19 +506,17 @@ class TIGERBoundaryCreator:
             # Add county name to TIGER data
             gdf['county_name'] = gdf['COUNTYFP'].map(county_fips_to_name)
             
-            # Create a mapping for Washington townships
+            # Washington townships are disambiguated by county
             washington_mapping = {
-                ('Washington', 'Bergen'): 'Washington_Bergen_003',
-                ('Washington', 'Hudson'): 'Washington_Hudson', 
-                ('Washington', 'Passaic'): 'Washington_Passaic',
-                ('Washington', 'Union'): 'Washington_Union'
+                'Bergen': 'Washington_Bergen_003',
+                'Hudson': 'Washington_Hudson',
+                'Passaic': 'Washington_Passaic',
+                'Union': 'Washington_Union'
             }
             
-            # Add mapped municipality names
-            gdf['mapped_municipality'] = gdf.apply(
-                lambda row: washington_mapping.get((row['NAME'], row['county_name']), row['NAME']), 
-                axis=1
-            )
+            # Add mapped municipality names (column-wise, no per-row apply)
+            washington_names = gdf['county_name'].map(washington_mapping).where(gdf['NAME'] == 'Washington')
+            gdf['mapped_municipality'] = washington_names.fillna(gdf['NAME'])
             
             # Match by both mapped name and county
             merged_gdf = gdf.merge(
@@ -556,13 +557,7 @@ class TIGERBoundaryCreator:
             if not zip_path.exists():
                 print(f"Downloading {data_type} data from NJDEP...")
                 try:
-                    response = requests.get(url, stream=True, verify=False)
-                    response.raise_for_status()
-                    
-                    with open(zip_path, 'wb') as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            f.write(chunk)
-                    
+                    download_file(url, zip_path)
                     print(f"Downloaded {data_type} data successfully")
                 except Exception as e:
                     print(f"Error downloading {data_type} data: {e}")
@@ -677,6 +672,7 @@ class TIGERBoundaryCreator:
             nj_counties = gdf[gdf['STATEFP'] == '34']
             target_counties = nj_counties[nj_counties['COUNTYFP'].isin(['003', '013', '017', '031', '039'])]  # Bergen, Essex, Hudson, Passaic, Union
             print(f"Filtered to {len(target_counties)} target counties in New Jersey")
+            target_counties = target_counties[[c for c in TIGER_KEEP_COLUMNS if c in target_counties.columns]]
             
             return target_counties
             
@@ -696,8 +692,9 @@ class TIGERBoundaryCreator:
             return None
         
         # Create the map
-        center_lat = municipalities_gdf.geometry.centroid.y.mean()
-        center_lon = municipalities_gdf.geometry.centroid.x.mean()
+        minx, miny, maxx, maxy = municipalities_gdf.total_bounds
+        center_lat = (miny + maxy) / 2
+        center_lon = (minx + maxx) / 2
         
         m = folium.Map(
             location=[center_lat, center_lon],
@@ -714,36 +711,34 @@ class TIGERBoundaryCreator:
             '039': 'Union'
         }
         
-        # Add each municipality with its real TIGER/Line boundary
-        for idx, row in municipalities_gdf.iterrows():
-            county_name = row['county']  # Use county from our merged data
-            county_color = self.county_colors.get(county_name, '#ffffff')
-            
-            # Convert geometry to GeoJSON
-            # Use geometry directly - no need to convert to JSON
-            
-            # Add polygon to map with compact popup
-            folium.GeoJson(
-                row.geometry,
-                style_function=lambda x, color=county_color: {
-                    'fillColor': color,
-                    'color': '#000000',  # Black outline
-                    'weight': 1.5,
-                    'fillOpacity': 0.6
-                },
-                popup=folium.Popup(
-                    f"""
-                    <div style='color: white; background: #2d2d2d; padding: 3px 5px; border-radius: 3px; width: 180px; font-size: 12px; margin: 0;'>
-                        <h4 style='color: {county_color}; margin: 0 0 2px 0; font-size: 13px; font-weight: bold; line-height: 1.2;'>{row['NAME']}</h4>
-                        <p style='margin: 0; font-size: 11px; line-height: 1.1;'><strong>County:</strong> {county_name}</p>
-                        <p style='margin: 0; font-size: 11px; line-height: 1.1;'><strong>Population:</strong> {row['population_2020']:,}</p>
-                        <p style='margin: 0; font-size: 11px; line-height: 1.1;'><strong>Area:</strong> {row['area_sq_miles']:.1f} sq mi</p>
-                        <p style='margin: 0; font-size: 11px; line-height: 1.1;'><strong>Density:</strong> {row['population_density']:.0f} people/sq mi</p>
-                    </div>
-                    """,
-                    max_width=190
-                )
-            ).add_to(m)
+        # Build every popup in one vectorized pass and add the layer as a single GeoJson
+        county_color = municipalities_gdf['county'].map(self.county_colors).fillna('#ffffff')
+        popup_html = (
+            "<div style='color: white; background: #2d2d2d; padding: 3px 5px; border-radius: 3px; width: 180px; font-size: 12px; margin: 0;'>"
+            "<h4 style='color: " + county_color + "; margin: 0 0 2px 0; font-size: 13px; font-weight: bold; line-height: 1.2;'>"
+            + municipalities_gdf['NAME'] + "</h4>"
+            "<p style='margin: 0; font-size: 11px; line-height: 1.1;'><strong>County:</strong> "
+            + municipalities_gdf['county'] + "</p>"
+            "<p style='margin: 0; font-size: 11px; line-height: 1.1;'><strong>Population:</strong> "
+            + municipalities_gdf['population_2020'].map('{:,}'.format) + "</p>"
+            "<p style='margin: 0; font-size: 11px; line-height: 1.1;'><strong>Area:</strong> "
+            + municipalities_gdf['area_sq_miles'].map('{:.1f}'.format) + " sq mi</p>"
+            "<p style='margin: 0; font-size: 11px; line-height: 1.1;'><strong>Density:</strong> "
+            + municipalities_gdf['population_density'].map('{:.0f}'.format) + " people/sq mi</p>"
+            "</div>"
+        )
+        features = municipalities_gdf[['geometry']].assign(county_color=county_color, popup_html=popup_html)
+        
+        folium.GeoJson(
+            features,
+            style_function=lambda feature: {
+                'fillColor': feature['properties']['county_color'],
+                'color': '#000000',  # Black outline
+                'weight': 1.5,
+                'fillOpacity': 0.6
+            },
+            popup=folium.GeoJsonPopup(fields=['popup_html'], labels=False, max_width=190)
+        ).add_to(m)
         
         # Add legend
         legend_html = '''
@@ -788,8 +783,9 @@ class TIGERBoundaryCreator:
         county_stats['population_density'] = county_stats['population_2020'] / county_stats['area_sq_miles']
         
         # Create the map
-        center_lat = counties_gdf.geometry.centroid.y.mean()
-        center_lon = counties_gdf.geometry.centroid.x.mean()
+        minx, miny, maxx, maxy = counties_gdf.total_bounds
+        center_lat = (miny + maxy) / 2
+        center_lon = (minx + maxx) / 2
         
         m = folium.Map(
             location=[center_lat, center_lon],
@@ -806,90 +802,68 @@ class TIGERBoundaryCreator:
             '039': 'Union'
         }
         
+        # Attach county names and statistics once instead of looking them up per row
+        counties_gdf = counties_gdf.assign(
+            county_name=counties_gdf['COUNTYFP'].map(county_fips_to_name).fillna('Unknown')
+        )
+        counties_gdf = counties_gdf.merge(
+            county_stats, left_on='county_name', right_on='county', how='left'
+        )
+        stat_columns = ['population_2020', 'area_sq_miles', 'population_density', 'municipality']
+        counties_gdf[stat_columns] = counties_gdf[stat_columns].fillna(0)
+        counties_gdf = counties_gdf.astype({'population_2020': int, 'municipality': int})
+        
         # Create feature groups for different scenarios
         five_county_group = folium.FeatureGroup(name='5-County Consolidation')
         three_county_group = folium.FeatureGroup(name='3-County Core (Bergen, Essex, Hudson)')
         
+        def county_popups(gdf, color, scenario):
+            """Compact popup HTML for every county in gdf, built column-wise"""
+            return (
+                "<div style='color: white; background: #2d2d2d; padding: 3px 5px; border-radius: 3px; text-align: center; width: 180px; font-size: 12px; margin: 0;'>"
+                "<h4 style='color: " + color + "; margin: 0 0 2px 0; font-size: 13px; font-weight: bold; line-height: 1.2;'>"
+                + gdf['county_name'] + " County</h4>"
+                "<p style='margin: 0; font-size: 11px; line-height: 1.1;'><strong>Population:</strong> "
+                + gdf['population_2020'].map('{:,}'.format) + "</p>"
+                "<p style='margin: 0; font-size: 11px; line-height: 1.1;'><strong>Area:</strong> "
+                + gdf['area_sq_miles'].map('{:.1f}'.format) + " sq mi</p>"
+                "<p style='margin: 0; font-size: 11px; line-height: 1.1;'><strong>Density:</strong> "
+                + gdf['population_density'].map('{:.0f}'.format) + " people/sq mi</p>"
+                "<p style='margin: 0; font-size: 11px; line-height: 1.1;'><strong>Municipalities:</strong> "
+                + gdf['municipality'].astype(str) + "</p>"
+                "<p style='margin: 2px 0 0 0; font-size: 10px; color: " + color + "; line-height: 1.1;'>Part of " + scenario + "</p>"
+                "</div>"
+            )
+        
         # 5-County Consolidation
-        for idx, row in counties_gdf.iterrows():
-            county_name = county_fips_to_name.get(row['COUNTYFP'], 'Unknown')
-            
-            # Get county statistics
-            county_data = county_stats[county_stats['county'] == county_name]
-            if not county_data.empty:
-                pop = county_data.iloc[0]['population_2020']
-                area = county_data.iloc[0]['area_sq_miles']
-                density = county_data.iloc[0]['population_density']
-                muni_count = county_data.iloc[0]['municipality']
-            else:
-                pop = area = density = muni_count = 0
-            
-            # Convert geometry to GeoJSON
-            # Use geometry directly - no need to convert to JSON
-            
-            # Add polygon to 5-county group with compact popup
-            folium.GeoJson(
-                row.geometry,
-                style_function=lambda x: {
-                    'fillColor': '#00d4ff',
-                    'color': '#000000',  # Black outline
-                    'weight': 2,
-                    'fillOpacity': 0.3
-                },
-                popup=folium.Popup(
-                    f"""
-                    <div style='color: white; background: #2d2d2d; padding: 3px 5px; border-radius: 3px; text-align: center; width: 180px; font-size: 12px; margin: 0;'>
-                        <h4 style='color: #00d4ff; margin: 0 0 2px 0; font-size: 13px; font-weight: bold; line-height: 1.2;'>{county_name} County</h4>
-                        <p style='margin: 0; font-size: 11px; line-height: 1.1;'><strong>Population:</strong> {pop:,}</p>
-                        <p style='margin: 0; font-size: 11px; line-height: 1.1;'><strong>Area:</strong> {area:.1f} sq mi</p>
-                        <p style='margin: 0; font-size: 11px; line-height: 1.1;'><strong>Density:</strong> {density:.0f} people/sq mi</p>
-                        <p style='margin: 0; font-size: 11px; line-height: 1.1;'><strong>Municipalities:</strong> {muni_count}</p>
-                        <p style='margin: 2px 0 0 0; font-size: 10px; color: #00d4ff; line-height: 1.1;'>Part of 5-County Consolidation</p>
-                    </div>
-                    """,
-                    max_width=190
-                )
-            ).add_to(five_county_group)
+        folium.GeoJson(
+            counties_gdf[['geometry']].assign(
+                popup_html=county_popups(counties_gdf, '#00d4ff', '5-County Consolidation')
+            ),
+            style_function=lambda x: {
+                'fillColor': '#00d4ff',
+                'color': '#000000',  # Black outline
+                'weight': 2,
+                'fillOpacity': 0.3
+            },
+            popup=folium.GeoJsonPopup(fields=['popup_html'], labels=False, max_width=190)
+        ).add_to(five_county_group)
         
         # 3-County Core
         three_county_fips = ['003', '013', '017']  # Bergen, Essex, Hudson
-        for idx, row in counties_gdf.iterrows():
-            if row['COUNTYFP'] in three_county_fips:
-                county_name = county_fips_to_name.get(row['COUNTYFP'], 'Unknown')
-                
-                # Get county statistics
-                county_data = county_stats[county_stats['county'] == county_name]
-                if not county_data.empty:
-                    pop = county_data.iloc[0]['population_2020']
-                    area = county_data.iloc[0]['area_sq_miles']
-                    density = county_data.iloc[0]['population_density']
-                    muni_count = county_data.iloc[0]['municipality']
-                else:
-                    pop = area = density = muni_count = 0
-                
-                # Add polygon to 3-county group with compact popup
-                folium.GeoJson(
-                    row.geometry,
-                    style_function=lambda x: {
-                        'fillColor': '#00ff88',
-                        'color': '#000000',  # Black outline
-                        'weight': 2,
-                        'fillOpacity': 0.4
-                    },
-                    popup=folium.Popup(
-                        f"""
-                        <div style='color: white; background: #2d2d2d; padding: 3px 5px; border-radius: 3px; text-align: center; width: 180px; font-size: 12px; margin: 0;'>
-                            <h4 style='color: #00ff88; margin: 0 0 2px 0; font-size: 13px; font-weight: bold; line-height: 1.2;'>{county_name} County</h4>
-                            <p style='margin: 0; font-size: 11px; line-height: 1.1;'><strong>Population:</strong> {pop:,}</p>
-                            <p style='margin: 0; font-size: 11px; line-height: 1.1;'><strong>Area:</strong> {area:.1f} sq mi</p>
-                            <p style='margin: 0; font-size: 11px; line-height: 1.1;'><strong>Density:</strong> {density:.0f} people/sq mi</p>
-                            <p style='margin: 0; font-size: 11px; line-height: 1.1;'><strong>Municipalities:</strong> {muni_count}</p>
-                            <p style='margin: 2px 0 0 0; font-size: 10px; color: #00ff88; line-height: 1.1;'>Part of 3-County Core</p>
-                        </div>
-                        """,
-                        max_width=190
-                    )
-                ).add_to(three_county_group)
+        core_gdf = counties_gdf[counties_gdf['COUNTYFP'].isin(three_county_fips)]
+        folium.GeoJson(
+            core_gdf[['geometry']].assign(
+                popup_html=county_popups(core_gdf, '#00ff88', '3-County Core')
+            ),
+            style_function=lambda x: {
+                'fillColor': '#00ff88',
+                'color': '#000000',  # Black outline
+                'weight': 2,
+                'fillOpacity': 0.4
+            },
+            popup=folium.GeoJsonPopup(fields=['popup_html'], labels=False, max_width=190)
+        ).add_to(three_county_group)
         
         # Add feature groups to map
         five_county_group.add_to(m)
@@ -935,6 +909,23 @@ class TIGERBoundaryCreator:
         return m
     
 
+    def maps_up_to_date(self):
+        """Whether every map is newer than the shapefiles, CSVs and code it is built from"""
+        inputs = list(self.tiger_dir.rglob('*.shp'))
+        if not inputs:
+            return False
+        inputs += list((self.data_dir / 'nj_state_data').rglob('*.shp'))
+        inputs += [self.data_dir / 'nj_municipalities.csv',
+                   self.data_dir / 'consolidation_scenarios.csv',
+                   Path(__file__)]
+        
+        outputs = [self.output_dir / filename for filename in self.MAP_FILES]
+        if not all(path.exists() for path in inputs + outputs):
+            return False
+        
+        newest_input = max(path.stat().st_mtime_ns for path in inputs)
+        return min(path.stat().st_mtime_ns for path in outputs) >= newest_input
+    
     def create_all_tiger_maps(self):
         """Create all maps using TIGER/Line data"""
         print("Creating TIGER/Line boundary maps...")